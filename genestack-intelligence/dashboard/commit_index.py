@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Commit History Index
+SQLite index of a repository's commits (author, dates, touched files and which
+branches reach them) kept under reports/.index. Each update only ingests the
+commits that are new since the refs were last indexed, so dashboard reruns and
+report scripts query the index instead of walking the whole history with git.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from git_backend import GitBackend, get_backend
+from git_history import HEAD, Commit, GitHistory
+
+# Bump whenever the schema changes; older index files are rebuilt from scratch
+INDEX_VERSION = 2
+
+DEFAULT_INDEX_DIR = Path("reports") / ".index"
+
+# Refs whose reachable commits are recorded (tags etc. are indexed but not tracked per ref)
+BRANCH_PREFIXES = ('refs/heads/', 'refs/remotes/')
+
+
+def index_path_for(repo_path: Union[str, Path], index_dir: Union[str, Path] = DEFAULT_INDEX_DIR) -> Path:
+    """One index file per checkout, named after the repo and its absolute path"""
+    repo = Path(repo_path).resolve()
+    digest = hashlib.sha1(str(repo).encode()).hexdigest()[:12]
+    return Path(index_dir) / f"{repo.name}-{digest}.sqlite"
+
+
+def is_branch(ref: str) -> bool:
+    return ref == HEAD or ref.startswith(BRANCH_PREFIXES)
+
+
+class CommitIndex:
+    """Commits, touched files and branch reachability of one repository"""
+
+    def __init__(self, repo_path: Union[str, Path], index_file: Optional[Union[str, Path]] = None,
+                 backend: Optional[GitBackend] = None):
+        self.repo_path = str(repo_path)
+        self.backend = backend or get_backend(self.repo_path)
+        self.path = Path(index_file) if index_file else index_path_for(repo_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_VERSION:
+                for table in ('commits', 'files', 'refs', 'reachable'):
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+                self._conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS commits (
+                    sha TEXT PRIMARY KEY,
+                    short_sha TEXT,
+                    parents TEXT,
+                    author TEXT,
+                    author_mailmap TEXT,
+                    date TEXT,
+                    date_iso TEXT,
+                    timestamp INTEGER,
+                    subject TEXT
+                );
+                CREATE TABLE IF NOT EXISTS files (
+                    sha TEXT,
+                    path TEXT,
+                    added INTEGER,
+                    deleted INTEGER,
+                    UNIQUE (sha, path)
+                );
+                CREATE INDEX IF NOT EXISTS files_sha ON files (sha);
+                CREATE TABLE IF NOT EXISTS refs (
+                    name TEXT PRIMARY KEY,
+                    short_name TEXT,
+                    sha TEXT
+                );
+                CREATE TABLE IF NOT EXISTS reachable (
+                    ref TEXT,
+                    sha TEXT,
+                    PRIMARY KEY (ref, sha)
+                ) WITHOUT ROWID;
+            """)
+
+    @classmethod
+    def open(cls, repo_path: Union[str, Path], index_file: Optional[Union[str, Path]] = None,
+             backend: Optional[GitBackend] = None) -> 'CommitIndex':
+        """Index for repo_path, brought up to date with its current refs"""
+        index = cls(repo_path, index_file, backend)
+        index.update()
+        return index
+
+    # -- ingestion ---------------------------------------------------------
+
+    def indexed_refs(self) -> Dict[str, Tuple[str, str]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT name, short_name, sha FROM refs").fetchall()
+        return {name: (short, sha) for name, short, sha in rows}
+
+    def update(self) -> int:
+        """Ingest commits added since the last update; returns how many were new"""
+        current = self.backend.refs()
+        indexed = self.indexed_refs()
+        if current == indexed:
+            return 0
+
+        # Walk outside the write lock; redone below if another writer got in first
+        new_commits = self._new_commits(current, indexed)
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            latest = {name: (short, sha) for name, short, sha
+                      in self._conn.execute("SELECT name, short_name, sha FROM refs")}
+            if latest == current:
+                return 0
+            if latest != indexed:
+                indexed = latest
+                new_commits = self._new_commits(current, indexed)
+
+            known = {sha for sha, in self._conn.execute("SELECT sha FROM commits")} if indexed else set()
+            tips = {ref[1] for name, ref in current.items() if indexed.get(name) != ref}
+            missing = tips - known - {c.sha for c in new_commits}
+            if missing:
+                # The walk failed (the git helpers return nothing on error); leave the refs
+                # unrecorded so the next update retries them
+                self._conn.rollback()
+                print(f"⚠️  Could not index {len(missing)} ref tip(s) of {self.repo_path}; will retry")
+                return 0
+
+            new_commits = [c for c in new_commits if c.sha not in known]
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO commits VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(c.sha, c.short_sha, ' '.join(c.parents), c.author, c.author_mailmap,
+                  c.date, c.date_iso, c.timestamp, c.subject) for c in new_commits])
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO files VALUES (?, ?, ?, ?)",
+                [(c.sha, path, added, deleted) for c in new_commits for path, added, deleted in c.files])
+
+            removed = indexed.keys() - current.keys()
+            for name in removed:
+                self._conn.execute("DELETE FROM refs WHERE name = ?", (name,))
+                self._conn.execute("DELETE FROM reachable WHERE ref = ?", (name,))
+
+            rewound = False
+            for name, (short, sha) in current.items():
+                old = indexed.get(name)
+                if old == (short, sha):
+                    continue
+                if is_branch(name):
+                    rewound |= not self._update_reachable(name, old[1] if old else None, sha)
+                self._conn.execute("INSERT OR REPLACE INTO refs VALUES (?, ?, ?)", (name, short, sha))
+
+            if removed or rewound:
+                self._prune()
+        return len(new_commits)
+
+    def _new_commits(self, current: Dict[str, Tuple[str, str]],
+                     indexed: Dict[str, Tuple[str, str]]) -> List[Commit]:
+        """Commits reachable from the changed refs but not from anything indexed before"""
+        tips = {sha for name, (_, sha) in current.items() if indexed.get(name) != current[name]}
+        if not tips:
+            return []
+        # Force-pushed tips may have been pruned from the object database
+        seen = self.backend.existing({sha for _, sha in indexed.values()})
+        return self.backend.commits(sorted(tips), sorted(seen))
+
+    def _update_reachable(self, ref: str, old_sha: Optional[str], new_sha: str) -> bool:
+        """Record the commits reachable from ref; False if it moved other than by fast-forward"""
+        fast_forward = old_sha is None or self.backend.is_ancestor(old_sha, new_sha)
+        if fast_forward and old_sha:
+            shas = self.backend.rev_list([new_sha], [old_sha])
+        else:
+            self._conn.execute("DELETE FROM reachable WHERE ref = ?", (ref,))
+            shas = self.backend.rev_list([new_sha])
+        self._conn.executemany("INSERT OR IGNORE INTO reachable VALUES (?, ?)",
+                               [(ref, sha) for sha in shas])
+        return fast_forward
+
+    def _prune(self):
+        """Drop commits no ref reaches any more (deleted branches, force pushes)"""
+        live = self.backend.rev_list()
+        if not live:
+            return
+        self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS live (sha TEXT PRIMARY KEY) WITHOUT ROWID")
+        self._conn.execute("DELETE FROM live")
+        self._conn.executemany("INSERT OR IGNORE INTO live VALUES (?)", [(sha,) for sha in live])
+        self._conn.execute("DELETE FROM files WHERE sha NOT IN (SELECT sha FROM live)")
+        self._conn.execute("DELETE FROM commits WHERE sha NOT IN (SELECT sha FROM live)")
+
+    # -- queries -----------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _ref_name(self, ref: str) -> str:
+        """Full ref name for a short one ("origin/main" -> "refs/remotes/origin/main")"""
+        if ref == HEAD or ref.startswith('refs/'):
+            return ref
+        rows = self._query("SELECT name FROM refs WHERE short_name = ? ORDER BY name", (ref,))
+        return rows[0][0] if rows else ref
+
+    def commit_count(self, ref: str = HEAD) -> int:
+        """Same as `git rev-list --count <ref>`"""
+        return self._query("SELECT COUNT(*) FROM reachable WHERE ref = ?", (self._ref_name(ref),))[0][0]
+
+    def author_counts(self, ref: Optional[str] = None) -> List[Tuple[str, int]]:
+        """(author, commits) busiest first, like `git shortlog -sn <ref>` (every ref when None)"""
+        if ref is None:
+            return self._query("SELECT author_mailmap, COUNT(*) AS n FROM commits "
+                               "GROUP BY author_mailmap ORDER BY n DESC, author_mailmap")
+        return self._query("SELECT c.author_mailmap, COUNT(*) AS n FROM reachable r "
+                           "JOIN commits c ON c.sha = r.sha WHERE r.ref = ? "
+                           "GROUP BY c.author_mailmap ORDER BY n DESC, c.author_mailmap",
+                           (self._ref_name(ref),))
+
+    def merges(self, ref: str = HEAD, subject_contains: Optional[str] = None) -> List[Tuple[str, int, List[str]]]:
+        """(sha, commit timestamp, parents) of merge commits reachable from ref"""
+        sql = ("SELECT c.sha, c.timestamp, c.parents FROM reachable r JOIN commits c ON c.sha = r.sha "
+               "WHERE r.ref = ? AND instr(c.parents, ' ') > 0")
+        params = (self._ref_name(ref),)
+        if subject_contains:
+            sql += " AND instr(c.subject, ?) > 0"
+            params += (subject_contains,)
+        return [(sha, ts, parents.split()) for sha, ts, parents in
+                self._query(sql + " ORDER BY c.timestamp DESC", params)]
+
+    def commit_timestamp(self, sha: str) -> Optional[int]:
+        rows = self._query("SELECT timestamp FROM commits WHERE sha = ?", (sha,))
+        return rows[0][0] if rows else None
+
+    def line_changes(self, ref: str = HEAD) -> Tuple[int, int]:
+        """Total (added, deleted) lines over the history of ref; binary files are skipped"""
+        added, deleted = self._query(
+            "SELECT COALESCE(SUM(f.added), 0), COALESCE(SUM(f.deleted), 0) FROM reachable r "
+            "JOIN files f ON f.sha = r.sha WHERE r.ref = ? AND f.added IS NOT NULL AND f.deleted IS NOT NULL",
+            (self._ref_name(ref),))[0]
+        return added, deleted
+
+    def history(self) -> GitHistory:
+        """The indexed commits as an in-memory GitHistory (remote branches and HEAD as refs)"""
+        files = {}
+        for sha, path, added, deleted in self._query("SELECT sha, path, added, deleted FROM files ORDER BY rowid"):
+            files.setdefault(sha, []).append((path, added, deleted))
+        commits = [
+            Commit(sha, short_sha, parents.split(), author, author_mailmap, date, date_iso, timestamp,
+                   subject, files.get(sha))
+            for sha, short_sha, parents, author, author_mailmap, date, date_iso, timestamp, subject
+            in self._query("SELECT * FROM commits")
+        ]
+        indexed = self.indexed_refs()
+        refs = {short: sha for name, (short, sha) in sorted(indexed.items())
+                if name.startswith('refs/remotes/')}
+        head = indexed.get(HEAD)
+        if head:
+            refs[HEAD] = head[1]
+        return GitHistory(commits, refs)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
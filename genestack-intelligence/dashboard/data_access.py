@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Dashboard Data Access
+Git-derived tables for the dashboard, memoized per repository state. Every loader
+takes the repo path plus a refs fingerprint (a hash of every ref tip and HEAD),
+so widget interactions reuse the cached tables and anything that moves a ref
+(fetch, commit, checkout) gets fresh ones. Caches are bounded in size and age and
+can be dropped explicitly with clear_caches().
+"""
+
+import os
+import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from commit_index import CommitIndex
+from git_backend import get_backend
+from git_history import GIT_ENV, HEAD, GitHistory, run_git
+
+# Each repo state keeps its own entries; a few states (repos / recent refs) are enough
+CACHE_MAX_ENTRIES = 16
+CACHE_TTL = 60 * 60  # seconds
+
+# git subprocesses run concurrently for per-branch / per-file lookups
+GIT_WORKERS = 8
+
+# Streamed `git log -p` output is read in chunks of at most this many bytes
+DIFF_READ_LIMIT = 64 * 1024
+
+# Authors shown (and styled) in the contribution calendar
+CALENDAR_TOP_AUTHORS = 25
+
+
+def run_parallel(func, jobs: list, workers: Optional[int] = None) -> list:
+    """func(*job) for every job on a bounded thread pool, results in job order"""
+    workers = workers or GIT_WORKERS
+    if len(jobs) <= 1 or workers <= 1:
+        return [func(*job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(lambda job: func(*job), jobs))
+
+
+def refs_fingerprint(repo_path: str) -> str:
+    """Hash of every ref tip (and HEAD); changes whenever the history a table is built from does"""
+    return get_backend(repo_path).refs_state()
+
+
+@st.cache_resource(max_entries=4, ttl=CACHE_TTL, show_spinner=False)
+def load_git_history(repo_path: str, refs_state: str) -> GitHistory:
+    """Shared commit history for repo_path (not copied per caller, treat as read-only)"""
+    try:
+        index = CommitIndex.open(repo_path)
+        try:
+            return index.history()
+        finally:
+            index.close()
+    except Exception:
+        # Index not writable (read-only checkout etc.): read the history straight from git
+        return GitHistory.load(get_backend(repo_path))
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_contributors(repo_path: str, refs_state: str, limit: int = 10) -> pd.DataFrame:
+    history = load_git_history(repo_path, refs_state)
+    contrib_df = pd.DataFrame(
+        [[count, author] for author, count in history.author_counts()[:limit]],
+        columns=["Commits", "Contributor"]
+    )
+    contrib_df["Commits"] = contrib_df["Commits"].astype(int)
+    return contrib_df
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_branches(repo_path: str, refs_state: str, limit: int = 10) -> pd.DataFrame:
+    """Busiest remote branches with their touched-file counts and most modified files"""
+    history = load_git_history(repo_path, refs_state)
+    branch_data = [[b, history.commit_count(b)] for b in history.branches()]
+    branch_df = pd.DataFrame(branch_data, columns=["Branch", "Commits"])
+    branch_df = branch_df.sort_values("Commits", ascending=False).head(limit)
+
+    def branch_top_files(branch_name: str, top: int = 10) -> str:
+        counts = history.file_change_counts(branch_name)
+        if not counts:
+            return ""
+        top_items = sorted(counts.items(), key=lambda x: x[1], reverse=True)[:top]
+        return ", ".join(f"{path} ({count})" for path, count in top_items)
+
+    branch_df["Updated Files"] = branch_df["Branch"].apply(lambda b: len(history.file_change_counts(b)))
+    branch_df["Top Modified Files"] = branch_df["Branch"].apply(branch_top_files)
+    return branch_df
+
+
+def branch_latest_diff(repo_path: str, branch_name: str, file_path: Optional[str] = None,
+                       max_chars: int = 2000) -> str:
+    """Return the most recent code diff for a file on the branch."""
+    pathspec = ['--', file_path] if file_path else []
+    hashes = run_git(repo_path, 'log', '-2', '--pretty=format:%H', branch_name, *pathspec).split()
+    if not hashes:
+        return "No diff available"
+    if len(hashes) == 1:
+        diff_output = run_git(repo_path, 'show', hashes[0], *pathspec)
+    else:
+        diff_output = run_git(repo_path, 'diff', hashes[1], hashes[0], *pathspec)
+    diff_output = diff_output.strip()
+    if not diff_output:
+        return "No diff available"
+    if len(diff_output) > max_chars:
+        return diff_output[:max_chars] + "\n... (truncated)"
+    return diff_output
+
+
+def branch_latest_diffs(repo_path: str, branch_name: str, file_paths: List[str],
+                        max_chars: int = 2000) -> Dict[str, str]:
+    """Latest diff of each file on the branch (same as branch_latest_diff), from one streamed `git log -p`.
+
+    A file's newest patch is what `git diff` between its two most recent commits shows;
+    a file with a single commit gets the `git show` form (commit header + patch). Reading
+    stops once every file has been seen in two commits, and nothing is buffered past the
+    display limit. Merges are diffed against their first parent, as `git diff` would.
+    Files the stream cannot be matched to (quoted names) fall back to branch_latest_diff().
+    """
+    wanted = list(dict.fromkeys(file_paths))
+    if not wanted:
+        return {}
+    headers = {f'diff --git a/{path} b/{path}'.encode(): path for path in wanted}
+    # Worst case is 4 bytes per character; decoding and truncating happens at the end
+    byte_cap = max_chars * 4 + 4
+    patches, commit_headers, seen = {}, {}, {}
+
+    try:
+        proc = subprocess.Popen(
+            ['git', '-c', 'core.quotePath=false', 'log', '-p', '--diff-merges=first-parent', '--pretty=medium',
+             '--no-decorate', '--no-color', '--no-ext-diff', '--no-renames', branch_name, '--', *wanted],
+            cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env={**os.environ, **GIT_ENV})
+    except OSError:
+        proc = None
+
+    if proc is not None:
+        commit_header, chunks, current, in_header, line_start = [], [], None, False, True
+        try:
+            while sum(1 for count in seen.values() if count > 1) < len(wanted):
+                chunk = proc.stdout.readline(DIFF_READ_LIMIT)
+                if not chunk:
+                    break
+                at_line_start, line_start = line_start, chunk.endswith(b'\n')
+                if at_line_start and (chunk.startswith(b'commit ') or chunk.startswith(b'diff --git ')):
+                    if current is not None:
+                        patches[current] = b''.join(chunks)
+                    current, chunks = None, []
+                    if chunk.startswith(b'commit '):
+                        commit_header, in_header = [chunk], True
+                        continue
+                    in_header = False
+                    path = headers.get(chunk.rstrip(b'\n'))
+                    if path is not None:
+                        seen[path] = seen.get(path, 0) + 1
+                        if seen[path] == 1:
+                            current = path
+                            commit_headers[path] = b''.join(commit_header)
+                target = commit_header if in_header else chunks if current is not None else None
+                if target is not None:
+                    size = sum(len(c) for c in target)
+                    if size < byte_cap:
+                        target.append(chunk[:byte_cap - size])
+            if current is not None:
+                patches[current] = b''.join(chunks)
+        finally:
+            proc.kill()
+            proc.stdout.close()
+            proc.wait()
+
+    diffs = {}
+    for path in wanted:
+        if path not in patches:
+            diffs[path] = branch_latest_diff(repo_path, branch_name, path, max_chars)
+            continue
+        diff_bytes = patches[path] if seen[path] > 1 else commit_headers[path] + patches[path]
+        diff_output = diff_bytes.decode('utf-8', errors='replace').strip()
+        if not diff_output:
+            diff_output = "No diff available"
+        elif len(diff_output) > max_chars:
+            diff_output = diff_output[:max_chars] + "\n... (truncated)"
+        diffs[path] = diff_output
+    return diffs
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_branch_file_stats(repo_path: str, refs_state: str, branches: Tuple[str, ...],
+                           limit: int = 10) -> pd.DataFrame:
+    """Top modified files per branch with their last change date"""
+    history = load_git_history(repo_path, refs_state)
+    rows = []
+    for branch_name in branches:
+        stats = {}
+        for commit in history.commits_on(branch_name):
+            current_date = commit.short_date
+            for file_path in commit.paths:
+                if file_path not in stats:
+                    stats[file_path] = {"count": 0, "last_date": current_date}
+                stats[file_path]["count"] += 1
+                # Keep the latest date
+                if stats[file_path]["last_date"] is None or (current_date and current_date > stats[file_path]["last_date"]):
+                    stats[file_path]["last_date"] = current_date
+        top_items = sorted(stats.items(), key=lambda x: x[1]["count"], reverse=True)[:limit]
+        rows.extend(
+            {
+                "Branch": branch_name,
+                "File": path,
+                "Changes": data["count"],
+                "Last Change": data["last_date"] or "",
+            }
+            for path, data in top_items
+        )
+    return pd.DataFrame(rows, columns=["Branch", "File", "Changes", "Last Change"])
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_branch_file_details(repo_path: str, refs_state: str, branches: Tuple[str, ...],
+                             limit: int = 10) -> pd.DataFrame:
+    """load_branch_file_stats() plus the latest diff of every file"""
+    rows = load_branch_file_stats(repo_path, refs_state, branches, limit).to_dict("records")
+
+    # The diffs are the only part that still needs git: one streamed log per branch, concurrently
+    files_by_branch = {}
+    for row in rows:
+        files_by_branch.setdefault(row["Branch"], []).append(row["File"])
+    branch_diffs = dict(zip(files_by_branch, run_parallel(
+        branch_latest_diffs, [(repo_path, branch, files) for branch, files in files_by_branch.items()])))
+    for row in rows:
+        row["Latest Diff"] = branch_diffs[row["Branch"]][row["File"]]
+    return pd.DataFrame(rows, columns=["Branch", "File", "Changes", "Last Change", "Latest Diff"])
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_branch_updates(repo_path: str, refs_state: str, branches: Tuple[str, ...],
+                        limit: int = 5) -> Dict[str, List[str]]:
+    """Latest commits per branch as "date — sha subject" lines"""
+    history = load_git_history(repo_path, refs_state)
+    return {
+        branch: [f"{c.date_iso} — {c.short_sha} {c.subject}".strip() for c in history.commits_on(branch)[:limit]]
+        for branch in branches
+    }
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_modified_files(repo_path: str, refs_state: str, limit: int = 10) -> pd.DataFrame:
+    history = load_git_history(repo_path, refs_state)
+    # Ties ordered like `sort -nr`
+    file_counts = sorted(history.file_change_counts(HEAD).items(), key=lambda x: (x[1], x[0]), reverse=True)[:limit]
+    file_df = pd.DataFrame(
+        [[count, path] for path, count in file_counts],
+        columns=["Changes", "File"]
+    )
+    file_df["Changes"] = file_df["Changes"].astype(int)
+    return file_df
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_pull_requests(repo_path: str, refs_state: str, limit: int = 10) -> pd.DataFrame:
+    """Most recent merge commits on HEAD"""
+    history = load_git_history(repo_path, refs_state)
+    pr_rows = [[c.sha, c.subject, c.author, c.date] for c in history.merges(HEAD, limit=limit)]
+    return pd.DataFrame(pr_rows, columns=["Commit", "Title", "Author", "Date"])
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_contribution_calendar(repo_path: str, refs_state: str, end_date: str, days: int = 365,
+                               top_n: int = CALENDAR_TOP_AUTHORS) -> Tuple[pd.DataFrame, int]:
+    """Weekly commits on HEAD per author over the `days` up to end_date (YYYY-MM-DD).
+
+    Returns (top_n busiest authors x Monday-labelled weeks, number of active authors);
+    the frame is empty when nobody committed in the window.
+    """
+    end = pd.Timestamp(end_date)
+    start = end - pd.Timedelta(days=days)
+    start_s, end_s = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+    # ISO dates compare as strings, so the window is applied before anything is materialized
+    history = load_git_history(repo_path, refs_state)
+    authors, dates = [], []
+    for commit in history.commits_on(HEAD):
+        date = commit.short_date
+        if start_s <= date <= end_s:
+            authors.append(commit.author.strip())
+            dates.append(date)
+    if not dates:
+        return pd.DataFrame(), 0
+
+    # Integer week bins, Monday-based like to_period("W")
+    first_monday = start - pd.Timedelta(days=start.weekday())
+    n_weeks = (end - pd.Timedelta(days=end.weekday()) - first_monday).days // 7 + 1
+    day_offsets = (pd.to_datetime(pd.Series(dates), format="%Y-%m-%d") - first_monday).dt.days.to_numpy()
+    weeks = day_offsets // 7
+
+    codes, names = pd.factorize(pd.Series(authors), sort=True)
+    counts = np.zeros((len(names), n_weeks), dtype=np.int64)
+    np.add.at(counts, (codes, weeks), 1)
+
+    totals = counts.sum(axis=1)
+    order = np.lexsort((np.arange(len(names)), -totals))[:top_n]
+    labels = [(first_monday + pd.Timedelta(weeks=i)).strftime("%Y-%m-%d") for i in range(n_weeks)]
+    return pd.DataFrame(counts[order], index=pd.Index(names[order], name="author"), columns=labels), len(names)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_contribution_counts(repo_path: str, refs_state: str,
+                             branches: Tuple[str, ...]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Commits per (author, branch) and per (author, branch, file), from one pass over the history.
+
+    HEAD is always included as a branch. Authors are mailmapped names, the same ones
+    load_contributors() reports. Slice the frames with contributor_stats().
+    """
+    history = load_git_history(repo_path, refs_state)
+    commit_counts, file_counts = Counter(), Counter()
+    for branch in dict.fromkeys((HEAD, *branches)):
+        for commit in history.commits_on(branch):
+            commit_counts[commit.author_mailmap, branch] += 1
+            for path in commit.paths:
+                file_counts[commit.author_mailmap, branch, path] += 1
+
+    commits_df = pd.DataFrame([(*key, n) for key, n in commit_counts.items()],
+                              columns=["Author", "Branch", "Commits"])
+    files_df = pd.DataFrame([(*key, n) for key, n in file_counts.items()],
+                            columns=["Author", "Branch", "File", "Changes"])
+    # Keys repeat across rows (every branch shares most of the history)
+    for df in (commits_df, files_df):
+        for column in ("Author", "Branch", "File"):
+            if column in df:
+                df[column] = df[column].astype("category")
+    return commits_df, files_df
+
+
+def contributor_stats(commits_df: pd.DataFrame, files_df: pd.DataFrame, contributor_name: str,
+                      branches: Tuple[str, ...], top: int = 10) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """(commits per branch, most modified files on HEAD) of one contributor, from load_contribution_counts()"""
+    mine = commits_df[(commits_df["Author"] == contributor_name) & commits_df["Branch"].isin(branches)]
+    branch_totals = dict(zip(mine["Branch"].astype(str), mine["Commits"].astype(int)))
+    branch_stats = {branch: branch_totals[branch] for branch in branches if branch_totals.get(branch)}
+
+    files = files_df[(files_df["Author"] == contributor_name) & (files_df["Branch"] == HEAD)]
+    counts = zip(files["File"].astype(str), files["Changes"].astype(int))
+    file_stats = dict(sorted(counts, key=lambda x: (x[1], x[0]), reverse=True)[:top])
+    return branch_stats, file_stats
+
+
+def clear_caches():
+    """Forget every cached table (e.g. after fetching or switching repositories)"""
+    for loader in (load_contributors, load_branches, load_branch_file_stats, load_branch_file_details,
+                   load_branch_updates, load_modified_files, load_pull_requests, load_contribution_calendar,
+                   load_contribution_counts, load_git_history):
+        loader.clear()
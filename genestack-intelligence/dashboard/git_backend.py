@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Git Backends
+The handful of repository reads the dashboard needs (refs, commit walks with
+touched files, ancestry checks), behind one interface. The CLI backend runs the
+git binary and is the default: one `git log --numstat` walks the full history
+faster than libgit2 diffs every tree, and its rename detection is git's own.
+The pygit2 backend reads objects in-process and is opt-in: set
+GENESTACK_GIT_BACKEND=pygit2 (it falls back to the CLI if pygit2 is missing or
+cannot open the repository).
+"""
+
+import hashlib
+import os
+import subprocess
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from git_history import GIT_ENV, HEAD, LOG_FORMAT, Commit, parse_log, run_git
+
+# Optional: in-process object access
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+BACKEND_ENV = 'GENESTACK_GIT_BACKEND'
+
+
+class GitBackend:
+    """Read-only access to one repository"""
+
+    name = 'base'
+
+    def __init__(self, repo_path: str):
+        self.repo_path = str(repo_path)
+
+    def refs(self) -> Dict[str, Tuple[str, str]]:
+        """Every ref (plus HEAD) as full name -> (short name, commit sha), tags peeled"""
+        raise NotImplementedError
+
+    def commits(self, include: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()) -> List[Commit]:
+        """Commits reachable from include (every ref when None) but not from exclude, with touched files"""
+        raise NotImplementedError
+
+    def rev_list(self, include: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()) -> List[str]:
+        """Shas reachable from include (every ref when None) but not from exclude"""
+        raise NotImplementedError
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        raise NotImplementedError
+
+    def existing(self, shas: Iterable[str]) -> set:
+        """The shas still present in the object database (force-pushed tips may be pruned)"""
+        raise NotImplementedError
+
+    def tracked_line_count(self) -> int:
+        """Newlines across all tracked files in the working tree (like `git ls-files | xargs wc -l`)"""
+        total = 0
+        for path in self.tracked_files():
+            try:
+                with open(os.path.join(self.repo_path, path), 'rb') as f:
+                    for block in iter(lambda: f.read(1 << 20), b''):
+                        total += block.count(b'\n')
+            except OSError:
+                continue
+        return total
+
+    def tracked_files(self) -> List[str]:
+        raise NotImplementedError
+
+    def refs_state(self) -> str:
+        """Fingerprint of every ref tip and HEAD"""
+        refs = self.refs()
+        state = '\n'.join(f'{name} {sha}' for name, (_, sha) in sorted(refs.items()))
+        return hashlib.sha1(state.encode()).hexdigest()
+
+
+class CliBackend(GitBackend):
+    """Runs the git binary for every read"""
+
+    name = 'cli'
+
+    def refs(self) -> Dict[str, Tuple[str, str]]:
+        refs = {}
+        output = run_git(self.repo_path, 'for-each-ref',
+                         '--format=%(refname) %(refname:short) %(objectname) %(objecttype) '
+                         '%(*objectname) %(*objecttype)')
+        for line in output.splitlines():
+            parts = line.split(' ')
+            if len(parts) < 4:
+                continue
+            name, short, sha, kind = parts[:4]
+            peeled, peeled_kind = (parts[4], parts[5]) if len(parts) > 5 and parts[4] else (sha, kind)
+            if peeled_kind != 'commit':
+                continue  # tags of trees / blobs cannot be walked
+            refs[name] = (short, peeled)
+        head = run_git(self.repo_path, 'rev-parse', '--verify', '-q', 'HEAD').strip()
+        if head:
+            refs[HEAD] = (HEAD, head)
+        return refs
+
+    def _rev_walk(self, command: List[str], include: Optional[Iterable[str]], exclude: Iterable[str]) -> str:
+        """Run a revision walk over include minus exclude, passing the revisions on stdin"""
+        include = None if include is None else list(include)
+        if include == []:
+            return ""
+        revs = ''.join(f'{sha}\n' for sha in include or ()) + ''.join(f'^{sha}\n' for sha in exclude)
+        args = ['--all'] if include is None else []
+        return run_git(self.repo_path, *command, *args, '--stdin', input=revs)
+
+    def commits(self, include: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()) -> List[Commit]:
+        return parse_log(self._rev_walk(['log', '--topo-order', f'--format={LOG_FORMAT}', '--numstat'],
+                                        include, exclude))
+
+    def rev_list(self, include: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()) -> List[str]:
+        return self._rev_walk(['rev-list'], include, exclude).split()
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        try:
+            return subprocess.run(['git', 'merge-base', '--is-ancestor', ancestor, descendant],
+                                  cwd=self.repo_path, capture_output=True,
+                                  env={**os.environ, **GIT_ENV}).returncode == 0
+        except OSError:
+            return False
+
+    def existing(self, shas: Iterable[str]) -> set:
+        shas = list(shas)
+        if not shas:
+            return set()
+        output = run_git(self.repo_path, 'cat-file', '--batch-check', input='\n'.join(shas) + '\n')
+        return {line.split(' ', 1)[0] for line in output.splitlines() if not line.endswith(' missing')}
+
+    def tracked_files(self) -> List[str]:
+        return [path for path in run_git(self.repo_path, 'ls-files', '-z').split('\0') if path]
+
+
+def _short_ref_name(name: str) -> str:
+    for prefix in ('refs/heads/', 'refs/tags/', 'refs/remotes/', 'refs/'):
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+def _git_date(when: int, offset: int) -> datetime:
+    return datetime.fromtimestamp(when, timezone(timedelta(minutes=offset)))
+
+
+def _git_offset(offset: int) -> str:
+    sign = '+' if offset >= 0 else '-'
+    return f"{sign}{abs(offset) // 60:02d}{abs(offset) % 60:02d}"
+
+
+def _subject(message: str) -> str:
+    """First paragraph of a commit message on one line (git's %s)"""
+    lines = []
+    for line in message.strip('\n').split('\n'):
+        if not line.strip():
+            break
+        lines.append(line.strip())
+    return ' '.join(lines)
+
+
+class Pygit2Backend(GitBackend):
+    """Walks commits and trees in-process through libgit2"""
+
+    name = 'pygit2'
+
+    def __init__(self, repo_path: str):
+        super().__init__(repo_path)
+        self.repo = pygit2.Repository(self.repo_path)
+        try:
+            self.mailmap = pygit2.Mailmap.from_repository(self.repo)
+        except Exception:
+            self.mailmap = None
+
+    def refs(self) -> Dict[str, Tuple[str, str]]:
+        refs = {}
+        for name in self.repo.references:
+            try:
+                target = self.repo.references[name].peel(pygit2.Commit)
+            except Exception:
+                continue  # tags of trees / blobs, dangling symbolic refs
+            refs[name] = (_short_ref_name(name), str(target.id))
+        if not self.repo.head_is_unborn:
+            try:
+                refs[HEAD] = (HEAD, str(self.repo.head.peel(pygit2.Commit).id))
+            except Exception:
+                pass
+        return refs
+
+    def _walker(self, include: Optional[Iterable[str]], exclude: Iterable[str]):
+        tips = [sha for _, sha in self.refs().values()] if include is None else list(include)
+        tips = [sha for sha in tips if sha in self.repo]
+        if not tips:
+            return []
+        walker = self.repo.walk(tips[0], pygit2.enums.SortMode.TOPOLOGICAL)
+        for sha in tips[1:]:
+            walker.push(sha)
+        for sha in exclude:
+            if sha in self.repo:
+                walker.hide(sha)
+        return walker
+
+    def commits(self, include: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()) -> List[Commit]:
+        return [self._commit(commit) for commit in self._walker(include, exclude)]
+
+    def rev_list(self, include: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()) -> List[str]:
+        return [str(commit.id) for commit in self._walker(include, exclude)]
+
+    def _commit(self, commit) -> Commit:
+        author = commit.author
+        author_mailmap = author.name
+        if self.mailmap is not None:
+            author_mailmap = self.mailmap.resolve_signature(author).name
+        when = _git_date(author.time, author.offset)
+        offset = _git_offset(author.offset)
+        # Same as `git log --numstat`: no file list for merges, renames reported at their new path
+        files = []
+        if len(commit.parents) <= 1:
+            if commit.parents:
+                diff = self.repo.diff(commit.parents[0], commit)
+            else:
+                diff = commit.tree.diff_to_tree(swap=True)
+            diff.find_similar()
+            for patch in diff:
+                delta = patch.delta
+                path = delta.new_file.path if delta.status != pygit2.enums.DeltaStatus.DELETED else delta.old_file.path
+                if delta.is_binary:
+                    files.append((path, None, None))
+                else:
+                    _, added, deleted = patch.line_stats
+                    files.append((path, added, deleted))
+        return Commit(
+            str(commit.id), str(commit.short_id), [str(p) for p in commit.parent_ids], author.name, author_mailmap,
+            f"{when.strftime('%a %b')} {when.day} {when.strftime('%H:%M:%S %Y')} {offset}",
+            f"{when.strftime('%Y-%m-%d %H:%M:%S')} {offset}",
+            commit.commit_time, _subject(commit.message), files)
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        try:
+            return ancestor == descendant or self.repo.descendant_of(descendant, ancestor)
+        except Exception:
+            return False
+
+    def existing(self, shas: Iterable[str]) -> set:
+        return {sha for sha in shas if sha in self.repo}
+
+    def tracked_files(self) -> List[str]:
+        return [entry.path for entry in self.repo.index]
+
+
+def get_backend(repo_path: str, name: Optional[str] = None) -> GitBackend:
+    """The git CLI, or pygit2 when asked for explicitly (name or GENESTACK_GIT_BACKEND) and usable"""
+    name = (name or os.environ.get(BACKEND_ENV) or 'auto').lower()
+    if name == 'pygit2' and PYGIT2_AVAILABLE:
+        try:
+            return Pygit2Backend(repo_path)
+        except Exception:
+            pass
+    return CliBackend(repo_path)
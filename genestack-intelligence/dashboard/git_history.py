@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Git History Model
+Reads the whole commit graph in one pass (see git_backend.py) and answers the
+dashboard's git questions (contributors, branch sizes, touched files, merges,
+calendar) from memory instead of running git once per question.
+"""
+
+import heapq
+import os
+import subprocess
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Record / field separators for the log format (never appear in commit metadata)
+RS = '\x1e'
+US = '\x1f'
+LOG_FIELDS = ['%H', '%h', '%P', '%an', '%aN', '%ad', '%ai', '%ct', '%s']
+LOG_FORMAT = RS + US.join(LOG_FIELDS)
+
+HEAD = 'HEAD'
+
+# Read-only git commands must not take index.lock, so parallel calls never block each other
+GIT_ENV = {'GIT_OPTIONAL_LOCKS': '0'}
+
+
+def run_git(repo_path: str, *args: str, input: Optional[str] = None) -> str:
+    """Run git with an argument list (no shell); returns stdout, or "" on failure"""
+    try:
+        result = subprocess.run(['git', *args], cwd=repo_path, capture_output=True, input=input,
+                                env={**os.environ, **GIT_ENV}, encoding='utf-8', errors='replace',
+                                check=True)
+        return result.stdout
+    except (subprocess.CalledProcessError, OSError):
+        return ""
+
+
+def resolve_renamed_path(path: str) -> str:
+    """Destination path of a --numstat rename ("a => b" or "dir/{a => b}/file")"""
+    if ' => ' not in path:
+        return path
+    if '{' in path and '}' in path:
+        prefix, rest = path.split('{', 1)
+        inner, suffix = rest.split('}', 1)
+        new = inner.split(' => ', 1)[1]
+        return (prefix + new + suffix).replace('//', '/')
+    return path.split(' => ', 1)[1]
+
+
+class Commit:
+    """One commit: metadata plus the files it touched (path, lines added, lines deleted)"""
+
+    __slots__ = ('sha', 'short_sha', 'parents', 'author', 'author_mailmap', 'date',
+                 'date_iso', 'timestamp', 'subject', 'files')
+
+    def __init__(self, sha: str, short_sha: str, parents: List[str], author: str, author_mailmap: str,
+                 date: str, date_iso: str, timestamp: int, subject: str,
+                 files: Optional[List[Tuple[str, Optional[int], Optional[int]]]] = None):
+        self.sha = sha
+        self.short_sha = short_sha
+        self.parents = parents
+        self.author = author                  # %an, as in `git log --author`
+        self.author_mailmap = author_mailmap  # %aN, as in `git shortlog`
+        self.date = date                      # %ad, default format
+        self.date_iso = date_iso              # %ai, same as --date=iso
+        self.timestamp = timestamp            # %ct
+        self.subject = subject
+        self.files = files or []
+
+    @property
+    def short_date(self) -> str:
+        """Author date as YYYY-MM-DD (same as --date=short)"""
+        return self.date_iso[:10]
+
+    @property
+    def is_merge(self) -> bool:
+        return len(self.parents) > 1
+
+    @property
+    def paths(self) -> List[str]:
+        return [path for path, _, _ in self.files]
+
+
+def parse_log(output: str) -> List[Commit]:
+    """Parse `git log --format=LOG_FORMAT --numstat` output"""
+    commits = []
+    for record in output.split(RS):
+        if not record.strip():
+            continue
+        header, _, numstat = record.partition('\n')
+        fields = header.split(US)
+        if len(fields) < len(LOG_FIELDS):
+            continue
+        sha, short_sha, parents, author, author_mailmap, date, date_iso, timestamp, subject = \
+            fields[:len(LOG_FIELDS)]
+
+        files = []
+        for line in numstat.split('\n'):
+            parts = line.split('\t', 2)
+            if len(parts) != 3:
+                continue
+            added, deleted, path = parts
+            files.append((resolve_renamed_path(path),
+                          int(added) if added.isdigit() else None,
+                          int(deleted) if deleted.isdigit() else None))
+
+        commits.append(Commit(sha, short_sha, parents.split(), author, author_mailmap, date, date_iso,
+                              int(timestamp) if timestamp.isdigit() else 0, subject, files))
+    return commits
+
+
+class GitHistory:
+    """In-memory commit graph; per-ref walks are done without calling git again"""
+
+    def __init__(self, commits: List[Commit], refs: Dict[str, str]):
+        # every commit of the repository; per-ref order comes from _walk()
+        self.commits = commits
+        self.refs = refs
+        self._index = {commit.sha: i for i, commit in enumerate(commits)}
+        self._by_ref = {}
+
+    @classmethod
+    def load(cls, backend) -> 'GitHistory':
+        """Read the full history through a git_backend.GitBackend"""
+        all_refs = backend.refs()
+        refs = {short: sha for name, (short, sha) in sorted(all_refs.items()) if name.startswith('refs/remotes/')}
+        if HEAD in all_refs:
+            refs[HEAD] = all_refs[HEAD][1]
+
+        if not refs:
+            return cls([], {})
+        return cls(backend.commits(), refs)
+
+    def branches(self) -> List[str]:
+        """Remote branches, in `git branch -r` order"""
+        return [name for name in self.refs if name != HEAD]
+
+    def commits_on(self, ref: str = HEAD) -> List[Commit]:
+        """Commits reachable from ref, newest first (like `git log <ref>`)"""
+        if ref not in self._by_ref:
+            self._by_ref[ref] = self._walk(self.refs.get(ref))
+        return self._by_ref[ref]
+
+    def _walk(self, tip: Optional[str]) -> List[Commit]:
+        """Same order as git's default revision walk: newest commit date first, ties first-queued"""
+        start = self._index.get(tip)
+        if start is None:
+            return []
+        queue = [(-self.commits[start].timestamp, 0, start)]
+        seen = {start}
+        queued = 1
+        walked = []
+        while queue:
+            _, _, i = heapq.heappop(queue)
+            commit = self.commits[i]
+            walked.append(commit)
+            for parent in commit.parents:
+                j = self._index.get(parent)
+                if j is None or j in seen:
+                    continue
+                seen.add(j)
+                heapq.heappush(queue, (-self.commits[j].timestamp, queued, j))
+                queued += 1
+        return walked
+
+    def commit_count(self, ref: str = HEAD) -> int:
+        """Same as `git rev-list --count <ref>`"""
+        return len(self.commits_on(ref))
+
+    def author_counts(self) -> List[Tuple[str, int]]:
+        """(author, commits) over all refs, busiest first (like `git shortlog -sn --all`)"""
+        counts = Counter(commit.author_mailmap for commit in self.commits)
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def file_change_counts(self, ref: str = HEAD, commits: Optional[Iterable[Commit]] = None) -> Counter:
+        """How many commits touched each file (like `git log --name-only | sort | uniq -c`)"""
+        counts = Counter()
+        for commit in (self.commits_on(ref) if commits is None else commits):
+            counts.update(commit.paths)
+        return counts
+
+    def merges(self, ref: str = HEAD, limit: Optional[int] = None) -> List[Commit]:
+        """Merge commits reachable from ref, newest first (like `git log --merges`)"""
+        found = [commit for commit in self.commits_on(ref) if commit.is_merge]
+        return found[:limit] if limit is not None else found
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Lazy Dashboard Panels
+Heavy dashboard sections are registered as panels that only compute when the
+user opens them, so the first paint does not wait on git history, diffs or
+inventory files. Open panels run as Streamlit fragments where available, which
+lets widgets inside a panel rerun just that panel.
+"""
+
+from typing import Any, Callable, Optional
+
+import streamlit as st
+
+# st.fragment arrived in Streamlit 1.37 (st.experimental_fragment before that)
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+FRAGMENTS_AVAILABLE = _fragment is not None
+
+
+def fragment(func: Callable, run_every: Optional[float] = None) -> Callable:
+    """func as a Streamlit fragment (rerun every run_every seconds if set) when supported, otherwise unchanged"""
+    if not FRAGMENTS_AVAILABLE:
+        return func
+    return _fragment(func, run_every=run_every) if run_every else _fragment(func)
+
+
+def lazy_panel(title: str, key: str, render: Callable[..., Any], *args,
+               default_open: bool = False, help: str = None, **kwargs) -> bool:
+    """Show a toggle for a panel and call render(*args, **kwargs) only while it is open.
+
+    The open state lives in st.session_state, so it survives reruns; returns whether
+    the panel was rendered.
+    """
+    opened = st.toggle(title, value=default_open, key=f"lazy_panel_{key}", help=help)
+    if opened:
+        fragment(render)(*args, **kwargs)
+    return opened
@@ -1,21 +1,17 @@
-import subprocess
+import os
 import statistics
 import json
 from datetime import datetime
 
-# -------------------------------------------------------
-# Helper: run shell command
-# -------------------------------------------------------
-def sh(cmd):
-    return subprocess.check_output(cmd, shell=True, text=True).strip()
-
+from commit_index import CommitIndex
+from git_backend import get_backend
 
 # -------------------------------------------------------
 # KPI #1 — Commit Frequency
 # -------------------------------------------------------
-def get_commit_frequency():
+def get_commit_frequency(index):
     try:
-        count = int(sh("git rev-list --count HEAD"))
+        count = index.commit_count("HEAD")
         # Heuristic scaling to 0–100%
         score = min(100, (count / 2000) * 100)
         return round(score, 2), count
@@ -30,20 +26,19 @@ def get_commit_frequency():
 # - find merge commits (those with "Merge pull request")
 # - extract time difference between parent commits
 # - compute average (scaled to 0–100)
-def get_review_velocity():
+def get_review_velocity(index):
     try:
-        log = sh(
-            "git log --merges --pretty='%ct %p' --grep='Merge pull request'"
-        ).splitlines()
+        # "Merge pull request" is matched against the subject, where GitHub puts it
+        merges = index.merges("HEAD", subject_contains="Merge pull request")
 
         deltas = []
-        for line in log:
-            parts = line.split()
-            if len(parts) < 3:
+        for _, merge_ts, parents in merges:
+            if len(parents) < 2:
                 continue
 
-            merge_ts = int(parts[0])
-            parent_ts = int(sh(f"git show -s --pretty='%ct' {parts[2]}"))
+            parent_ts = index.commit_timestamp(parents[1])
+            if parent_ts is None:
+                continue
             delta_hours = (merge_ts - parent_ts) / 3600
             deltas.append(delta_hours)
 
@@ -61,21 +56,14 @@ def get_review_velocity():
 # -------------------------------------------------------
 # KPI #3 — Churn Stability
 # -------------------------------------------------------
-def get_churn_stability():
+def get_churn_stability(index, repo_path):
     try:
-        lines = sh("git log --pretty=tformat: --numstat").splitlines()
-        additions, deletions = 0, 0
-
-        for l in lines:
-            parts = l.split()
-            if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
-                additions += int(parts[0])
-                deletions += int(parts[1])
+        additions, deletions = index.line_changes("HEAD")
 
         churn = additions + deletions
 
         # estimate total code size
-        kloc = int(sh("git ls-files | xargs wc -l | tail -1").split()[0])
+        kloc = get_backend(repo_path).tracked_line_count()
         if kloc == 0:
             return 0, 0
 
@@ -90,10 +78,15 @@ def get_churn_stability():
 # -------------------------------------------------------
 # Collect repo health metrics
 # -------------------------------------------------------
-def load_repo_health():
-    commit_score, commit_count = get_commit_frequency()
-    review_score, review_hours = get_review_velocity()
-    churn_score, churn_ops = get_churn_stability()
+def load_repo_health(repo_path=None):
+    repo_path = repo_path or os.getcwd()
+    index = CommitIndex.open(repo_path)
+    try:
+        commit_score, commit_count = get_commit_frequency(index)
+        review_score, review_hours = get_review_velocity(index)
+        churn_score, churn_ops = get_churn_stability(index, repo_path)
+    finally:
+        index.close()
 
     return {
         "Commit Frequency": {
@@ -1,14 +1,196 @@
 """
 Simple Repository Manager for Genestack Intelligence
-Handles cloning and managing any Git repository for analysis
+Handles cloning and managing any Git repository for analysis. Clones can also run
+as background prefetch jobs (clone + commit index) that the dashboard polls for
+progress, so the page keeps rendering while a repository is being fetched.
 """
+import hashlib
 import os
+import re
 import subprocess
 import tempfile
 import shutil
+import threading
+import time
 from pathlib import Path
+from typing import Callable, Dict, Optional
 import streamlit as st
 
+# Optional: warm the commit index while prefetching
+try:
+    from commit_index import CommitIndex
+    COMMIT_INDEX_AVAILABLE = True
+except ImportError:
+    COMMIT_INDEX_AVAILABLE = False
+
+CLONE_TIMEOUT = 300  # seconds
+
+# "Receiving objects:  45% (450/1000)" etc. in `git clone --progress` output
+PROGRESS_RE = re.compile(r'(Counting|Compressing|Receiving|Resolving) (?:objects|deltas):\s+(\d+)%')
+
+# Share of the job's progress bar each clone phase ends at
+PHASE_PROGRESS = {'Counting': 0.05, 'Compressing': 0.1, 'Receiving': 0.75, 'Resolving': 0.85}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize Git URL for comparison"""
+    url = url.strip()
+    # Convert SSH to HTTPS
+    if url.startswith("git@"):
+        url = url.replace(":", "/").replace("git@", "https://")
+    elif url.startswith("git://"):
+        url = url.replace("git://", "https://")
+    # Remove .git suffix
+    if url.endswith(".git"):
+        url = url[:-4]
+    # Remove trailing slash
+    url = url.rstrip("/")
+    return url.lower()
+
+
+def clone_path_for(repo_url: str) -> str:
+    """One clone directory per normalized URL (forks and other hosts with the same repo name differ)"""
+    repo_name = repo_url.rstrip('/').split('/')[-1].replace('.git', '')
+    digest = hashlib.sha1(normalize_url(repo_url).encode()).hexdigest()[:12]
+    return os.path.join(tempfile.gettempdir(), f"genestack_analysis_{repo_name}-{digest}")
+
+
+def clone_repository(repo_url: str, clone_path: str,
+                     on_progress: Optional[Callable[[str, int], None]] = None) -> Optional[str]:
+    """Shallow-clone repo_url into clone_path (replacing it); returns an error message or None.
+
+    The clone goes to a staging directory first, so an existing clone stays readable until
+    the new one is complete. on_progress(phase, percent) is called for every progress line.
+    """
+    staging_path = clone_path + ".partial"
+    if os.path.exists(staging_path):
+        shutil.rmtree(staging_path)
+    try:
+        proc = subprocess.Popen(['git', 'clone', '--progress', '--depth', '1', repo_url, staging_path],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except OSError as e:
+        return str(e)
+
+    # Progress lines are separated by \r; stop reading once the timeout has passed
+    deadline = time.monotonic() + CLONE_TIMEOUT
+    timer = threading.Timer(CLONE_TIMEOUT, proc.kill)
+    timer.start()
+    stderr_lines, buffer = [], b''
+    try:
+        for chunk in iter(lambda: proc.stderr.read1(4096), b''):
+            buffer += chunk
+            *lines, buffer = re.split(rb'[\r\n]', buffer)
+            for line in lines:
+                text = line.decode('utf-8', errors='replace').strip()
+                match = PROGRESS_RE.search(text)
+                if match:
+                    if on_progress:
+                        on_progress(match.group(1), int(match.group(2)))
+                elif text:
+                    stderr_lines.append(text)
+        proc.wait()
+    finally:
+        timer.cancel()
+    error = None
+    if time.monotonic() >= deadline:
+        error = "Clone operation timed out. Repository may be too large."
+    elif proc.returncode != 0:
+        error = '\n'.join(stderr_lines) or f"git clone exited with {proc.returncode}"
+    if error:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        return error
+
+    if os.path.exists(clone_path):
+        old_path = clone_path + ".old"
+        shutil.rmtree(old_path, ignore_errors=True)
+        os.replace(clone_path, old_path)
+        os.replace(staging_path, clone_path)
+        shutil.rmtree(old_path, ignore_errors=True)
+    else:
+        os.replace(staging_path, clone_path)
+    return None
+
+
+class PrefetchJob:
+    """Background clone + commit index of one repository; the fields are polled by the UI"""
+
+    def __init__(self, repo_url: str, clone_path: str):
+        self.repo_url = repo_url
+        self.clone_path = clone_path
+        self.progress = 0.0
+        self.message = "Queued"
+        self.error = None
+        self.done = False
+        self.started = time.time()
+        self._thread = threading.Thread(target=self._run, name=f"prefetch-{os.path.basename(clone_path)}",
+                                        daemon=True)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def ready(self) -> bool:
+        return self.done and self.error is None
+
+    def start(self) -> 'PrefetchJob':
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job has finished; True if it did within timeout"""
+        self._thread.join(timeout)
+        return self.done
+
+    def _clone_progress(self, phase: str, percent: int):
+        phases = list(PHASE_PROGRESS)
+        start = PHASE_PROGRESS[phases[phases.index(phase) - 1]] if phases.index(phase) else 0.0
+        self.progress = start + (PHASE_PROGRESS[phase] - start) * percent / 100
+        self.message = f"Cloning: {phase.lower()} {percent}%"
+
+    def _run(self):
+        try:
+            self.message = f"Cloning {self.repo_url}"
+            self.error = clone_repository(self.repo_url, self.clone_path, self._clone_progress)
+            if self.error:
+                return
+            # Warm the on-disk commit index, so the dashboard's first render only reads it
+            if COMMIT_INDEX_AVAILABLE:
+                self.progress, self.message = PHASE_PROGRESS['Resolving'], "Indexing commit history"
+                try:
+                    CommitIndex.open(self.clone_path).close()
+                except Exception:
+                    pass  # the dashboard falls back to reading history from git
+            self.progress, self.message = 1.0, "Ready"
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self.done = True
+
+
+# Jobs outlive reruns and sessions: one per clone directory
+_prefetch_jobs: Dict[str, PrefetchJob] = {}
+_prefetch_lock = threading.Lock()
+
+
+def start_prefetch(repo_url: str, refresh: bool = False) -> PrefetchJob:
+    """Running or finished job for repo_url, starting a new clone if there is none (or refresh).
+
+    A job still running on the clone directory is always returned as it is, never replaced.
+    """
+    clone_path = clone_path_for(repo_url)
+    with _prefetch_lock:
+        job = _prefetch_jobs.get(clone_path)
+        if job is not None:
+            if job.running or (not refresh and job.ready and os.path.exists(clone_path)):
+                return job
+        job = _prefetch_jobs[clone_path] = PrefetchJob(repo_url, clone_path).start()
+        return job
+
+
+def get_prefetch(repo_url: str) -> Optional[PrefetchJob]:
+    return _prefetch_jobs.get(clone_path_for(repo_url))
+
 
 class RepoManager:
     """Manages Git repository cloning and access"""
@@ -60,54 +242,31 @@ class RepoManager:
     
     def _normalize_url(self, url: str) -> str:
         """Normalize Git URL for comparison"""
-        url = url.strip()
-        # Convert SSH to HTTPS
-        if url.startswith("git@"):
-            url = url.replace(":", "/").replace("git@", "https://")
-        elif url.startswith("git://"):
-            url = url.replace("git://", "https://")
-        # Remove .git suffix
-        if url.endswith(".git"):
-            url = url[:-4]
-        # Remove trailing slash
-        url = url.rstrip("/")
-        return url.lower()
+        return normalize_url(url)
+
+    def is_current_repo(self, repo_url: str) -> bool:
+        """True when repo_url is the repository the dashboard was started in"""
+        current_url = self._get_current_repo_url()
+        return bool(current_url) and self._normalize_url(current_url) == self._normalize_url(repo_url)
     
     def _clone_repo(self, repo_url: str) -> str:
         """Clone repository to temp directory"""
         with st.spinner(f"🔄 Cloning repository: {repo_url}"):
             try:
-                # Create temp directory
-                temp_base = tempfile.gettempdir()
-                repo_name = repo_url.split('/')[-1].replace('.git', '')
-                clone_path = os.path.join(temp_base, f"genestack_analysis_{repo_name}")
-                
-                # Remove if exists
-                if os.path.exists(clone_path):
-                    shutil.rmtree(clone_path)
-                
-                # Clone repo
-                result = subprocess.run(
-                    ['git', 'clone', '--depth', '1', repo_url, clone_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
-                )
-                
-                if result.returncode != 0:
-                    st.error(f"❌ Failed to clone repository: {result.stderr}")
+                # Share (and wait for) any background job on the same clone directory
+                job = start_prefetch(repo_url, refresh=True)
+                job.wait()
+                if job.error:
+                    st.error(f"❌ Failed to clone repository: {job.error}")
                     return os.getcwd()
                 
                 # Store in session state
-                st.session_state['cloned_repo_path'] = clone_path
+                st.session_state['cloned_repo_path'] = job.clone_path
                 st.session_state['cloned_repo_url'] = repo_url
                 
                 st.success(f"✅ Repository cloned successfully!")
-                return clone_path
+                return job.clone_path
                 
-            except subprocess.TimeoutExpired:
-                st.error("❌ Clone operation timed out. Repository may be too large.")
-                return os.getcwd()
             except Exception as e:
                 st.error(f"❌ Error cloning repository: {str(e)}")
                 return os.getcwd()
@@ -135,6 +294,11 @@ def get_repo_path(repo_url: str = None) -> str:
     return _repo_manager.get_repo_path(repo_url)
 
 
+def is_current_repo(repo_url: str) -> bool:
+    """True when repo_url is the repository the dashboard runs in (nothing to clone)"""
+    return _repo_manager.is_current_repo(repo_url)
+
+
 def cleanup_repos():
     """Clean up cloned repositories"""
     _repo_manager.cleanup()
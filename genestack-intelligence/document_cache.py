@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Shared Document Cache
+Parse-once cache of file text and YAML documents for the inventory and compatibility scanners.
+Entries are keyed by path, mtime and size, and evicted least-recently-used first.
+"""
+
+import os
+import threading
+import yaml
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+# Prefer the libyaml-backed loader, it parses several times faster
+try:
+    from yaml import CSafeLoader as SafeLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader
+    LIBYAML_AVAILABLE = False
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class CachedDocument:
+    """One file's contents; text and YAML documents are derived lazily and kept"""
+
+    def __init__(self, path: str, stamp: Tuple[int, int], data: bytes):
+        self.path = path
+        self.stamp = stamp
+        self.data = data
+        self._text = None
+        self._docs = None
+        self._error = None
+
+    @property
+    def text(self) -> str:
+        """File contents decoded as UTF-8"""
+        if self._text is None:
+            self._text = self.data.decode('utf-8', errors='ignore')
+        return self._text
+
+    @property
+    def docs(self) -> List[Any]:
+        """All YAML documents in the file (shared, treat as read-only); re-raises parse errors"""
+        if self._docs is None and self._error is None:
+            try:
+                self._docs = list(yaml.load_all(self.text, Loader=SafeLoader))
+            except yaml.YAMLError as e:
+                self._error = e
+        if self._error is not None:
+            raise self._error
+        return self._docs
+
+    @property
+    def doc(self) -> Any:
+        """First YAML document, the equivalent of yaml.safe_load"""
+        docs = self.docs
+        return docs[0] if docs else None
+
+
+class DocumentCache:
+    """LRU cache of CachedDocument entries keyed by (path, mtime, size)"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Union[str, Path]) -> CachedDocument:
+        """Return the cached document for path, re-reading it only if it changed on disk"""
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        with open(key, 'rb') as f:
+            entry = CachedDocument(key, stamp, f.read())
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def read_text(self, path: Union[str, Path]) -> str:
+        """File contents as text"""
+        return self.get(path).text
+
+    def load(self, path: Union[str, Path]) -> Any:
+        """First YAML document in the file"""
+        return self.get(path).doc
+
+    def load_all(self, path: Union[str, Path]) -> List[Any]:
+        """All YAML documents in the file"""
+        return self.get(path).docs
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None):
+        """Drop one path, or everything when no path is given"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache shared by every scanner (and every dashboard rerun)
+_SHARED_CACHE = None
+
+
+def get_document_cache() -> DocumentCache:
+    """Return the process-wide document cache"""
+    global _SHARED_CACHE
+
+    if _SHARED_CACHE is None:
+        _SHARED_CACHE = DocumentCache()
+    return _SHARED_CACHE
@@ -1,19 +1,20 @@
 #!/usr/bin/env python3
-import subprocess, os, datetime, matplotlib.pyplot as plt
+import os, sys, datetime, matplotlib.pyplot as plt
 import pandas as pd
+from pathlib import Path
+
+# The commit index lives with the dashboard modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "dashboard"))
+from commit_index import CommitIndex
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 outdir = f"reports/{today}"
 os.makedirs(outdir, exist_ok=True)
 
-def run(cmd): return subprocess.check_output(cmd, shell=True, text=True)
-
-log = run("git shortlog -sn")
-
-data = []
-for line in log.splitlines():
-    count, name = line.strip().split("\t")
-    data.append((name, int(count)))
+# Same counts as `git shortlog -sn`, read from the incrementally updated index
+index = CommitIndex.open(os.getcwd())
+data = [(name, int(count)) for name, count in index.author_counts("HEAD")]
+index.close()
 
 df = pd.DataFrame(data, columns=["name", "commits"])
 
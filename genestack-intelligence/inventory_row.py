@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Inventory Row
+Compact, fixed-schema storage for one version inventory entry. Rows use __slots__
+instead of a per-row dict but still behave like the dicts they replace
+(row["Component"], row.get(...), "Compatibility" in row, dict(row)).
+"""
+
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List
+
+# Inventory columns, in the order they are added to a row
+INVENTORY_FIELDS = [
+    "Component",
+    "Type",
+    "Version in Repo",
+    "Latest Upstream Version",
+    "Source Path",
+    "Notes",
+    "Comments",
+    "OpenStack Software Version",
+    "OpenStack Version (Numeric)",
+    "OpenStack Release Name",
+    "Compatibility",
+    "Recommended Upstream",
+]
+
+_SLOT_NAMES = tuple(
+    field.lower().replace("(", "").replace(")", "").replace(" ", "_") for field in INVENTORY_FIELDS
+)
+_FIELD_INDEX = {field: i for i, field in enumerate(INVENTORY_FIELDS)}
+
+# Marks a field that has not been set (distinct from a field set to None)
+_MISSING = object()
+
+
+class InventoryRow(MutableMapping):
+    """One inventory entry; a dict-compatible view over fixed slots"""
+
+    __slots__ = _SLOT_NAMES + ('_mask', '_extra')
+
+    def __init__(self, data: Any = None, **kwargs):
+        for slot in _SLOT_NAMES:
+            object.__setattr__(self, slot, _MISSING)
+        self._mask = 0
+        self._extra = None  # Fields outside the schema, only allocated if ever used
+        if data is not None:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'InventoryRow':
+        return data if isinstance(data, cls) else cls(data)
+
+    @property
+    def mask(self) -> int:
+        """Bit i is set when INVENTORY_FIELDS[i] has a value"""
+        return self._mask
+
+    def __getitem__(self, key: str) -> Any:
+        index = _FIELD_INDEX.get(key)
+        if index is None:
+            if self._extra is not None and key in self._extra:
+                return self._extra[key]
+            raise KeyError(key)
+        value = getattr(self, _SLOT_NAMES[index])
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        index = _FIELD_INDEX.get(key)
+        if index is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+            return
+        setattr(self, _SLOT_NAMES[index], value)
+        self._mask |= 1 << index
+
+    def __delitem__(self, key: str):
+        index = _FIELD_INDEX.get(key)
+        if index is None:
+            if self._extra is None or key not in self._extra:
+                raise KeyError(key)
+            del self._extra[key]
+            return
+        if not self._mask & (1 << index):
+            raise KeyError(key)
+        setattr(self, _SLOT_NAMES[index], _MISSING)
+        self._mask &= ~(1 << index)
+
+    def __contains__(self, key: object) -> bool:
+        index = _FIELD_INDEX.get(key)
+        if index is None:
+            return self._extra is not None and key in self._extra
+        return bool(self._mask & (1 << index))
+
+    def __iter__(self) -> Iterator[str]:
+        mask = self._mask
+        for i, field in enumerate(INVENTORY_FIELDS):
+            if mask & (1 << i):
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return bin(self._mask).count("1") + (len(self._extra) if self._extra else 0)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"InventoryRow({dict(self.items())!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+
+def inventory_columns(rows: Iterable[Mapping]) -> List[str]:
+    """Every field present in at least one row: schema fields first, then any others"""
+    mask = 0
+    extra = {}
+    for row in rows:
+        if isinstance(row, InventoryRow):
+            mask |= row.mask
+            if row._extra:
+                extra.update(dict.fromkeys(row._extra))
+        else:
+            for key in row:
+                index = _FIELD_INDEX.get(key)
+                if index is None:
+                    extra[key] = None
+                else:
+                    mask |= 1 << index
+    fields = [field for i, field in enumerate(INVENTORY_FIELDS) if mask & (1 << i)]
+    return fields + list(extra)
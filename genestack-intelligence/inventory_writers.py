@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Inventory Writers
+Row-at-a-time writers for the version inventory (CSV, Markdown and JSON Lines), so
+rows can be written out while the scan is still running.
+"""
+
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Mapping
+
+# Columns that can only be filled once the whole inventory is known
+WHOLE_INVENTORY_FIELDS = ["Compatibility", "Recommended Upstream"]
+
+
+def markdown_headers(openstack: bool, compatibility: bool = True) -> List[str]:
+    """Markdown table columns; OpenStack columns only when versions were resolved"""
+    # Order: Component, Type, Version in Repo, OpenStack Software Version (if available), Latest Upstream Version, then rest
+    headers = ["Component", "Type", "Version in Repo"]
+    if openstack:
+        headers.append("OpenStack Software Version")
+    headers.append("Latest Upstream Version")
+    if openstack:
+        headers.append("OpenStack Release Name")
+        if compatibility:
+            headers.extend(WHOLE_INVENTORY_FIELDS)
+    headers.extend(["Source Path", "Notes", "Comments"])
+    return headers
+
+
+def markdown_cells(item: Mapping, openstack: bool, compatibility: bool = True) -> List[Any]:
+    """Markdown table cells for one inventory row"""
+    row = [
+        item.get('Component', ''),
+        item.get('Type', ''),
+        item.get('Version in Repo', ''),
+    ]
+    # Add OpenStack Software Version right after Version in Repo
+    if openstack and "OpenStack Software Version" in item:
+        row.append(item.get('OpenStack Software Version', 'Unknown'))
+    # Add Latest Upstream Version
+    row.append(item.get('Latest Upstream Version') or 'N/A')
+    # Add remaining OpenStack fields
+    if openstack and "OpenStack Software Version" in item:
+        row.append(item.get('OpenStack Release Name', 'Unknown'))
+        if compatibility:
+            row.extend([
+                item.get('Compatibility', 'Unknown'),
+                item.get('Recommended Upstream', 'Unknown')
+            ])
+    # Add Source Path, Notes, and Comments
+    row.extend([
+        item.get('Source Path', ''),
+        item.get('Notes', ''),
+        item.get('Comments', '')
+    ])
+    return row
+
+
+def stream_fieldnames(openstack: bool) -> List[str]:
+    """CSV columns for a streamed inventory, fixed before the first row is seen"""
+    fieldnames = ['Component', 'Type', 'Version in Repo']
+    if openstack:
+        fieldnames.append('OpenStack Software Version')
+    fieldnames.append('Latest Upstream Version')
+    if openstack:
+        fieldnames.append('OpenStack Release Name')
+    fieldnames.extend(['Source Path', 'Notes', 'Comments'])
+    if openstack:
+        fieldnames.append('OpenStack Version (Numeric)')
+    return fieldnames
+
+
+class InventoryWriter:
+    """Base class: write(row) for each row, then close() (or use as a context manager)"""
+
+    def __init__(self, output_path: Path, newline: str = None, buffering: int = -1):
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.output_path, 'w', newline=newline, buffering=buffering)
+        self.count = 0
+
+    def write(self, item: Mapping):
+        self._write(item)
+        self.count += 1
+
+    def _write(self, item: Mapping):
+        raise NotImplementedError
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvInventoryWriter(InventoryWriter):
+    """Streams rows into a CSV file with a fixed header"""
+
+    def __init__(self, output_path: Path, fieldnames: List[str]):
+        super().__init__(output_path, newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=fieldnames, extrasaction='ignore')
+        self.writer.writeheader()
+
+    def _write(self, item: Mapping):
+        self.writer.writerow(item)
+
+
+class MarkdownInventoryWriter(InventoryWriter):
+    """Streams rows into a Markdown table"""
+
+    def __init__(self, output_path: Path, openstack: bool, compatibility: bool = True):
+        super().__init__(output_path)
+        self.openstack = openstack
+        self.compatibility = compatibility
+        headers = markdown_headers(openstack, compatibility)
+        self.file.write("# Genestack Component Version Inventory\n\n")
+        self.file.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        self.file.write("| " + " | ".join(headers) + " |\n")
+        self.file.write("|" + "|".join(["---" for _ in headers]) + "|\n")
+
+    def _write(self, item: Mapping):
+        cells = markdown_cells(item, self.openstack, self.compatibility)
+        self.file.write("| " + " | ".join(str(x) for x in cells) + " |\n")
+
+
+class JsonLinesInventoryWriter(InventoryWriter):
+    """One JSON object per line, flushed per row so consumers can follow the file"""
+
+    def __init__(self, output_path: Path):
+        super().__init__(output_path, buffering=1)
+
+    def _write(self, item: Mapping):
+        self.file.write(json.dumps(dict(item), default=str) + "\n")
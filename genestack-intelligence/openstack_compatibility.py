@@ -7,7 +7,6 @@ Detects and flags incompatibilities between OpenStack components.
 import os
 import re
 import json
-import yaml
 import csv
 import subprocess
 import requests
@@ -16,6 +15,8 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from collections import defaultdict
 
+from document_cache import get_document_cache
+
 # OpenStack release compatibility matrix
 OPENSTACK_RELEASES = {
     "2024.1": {  # Caracal
@@ -101,6 +102,7 @@ class OpenStackCompatibilityAnalyzer:
         self.compatibility_table = []
         self.component_versions = {}
         self.detected_release = None
+        self.documents = get_document_cache()
         
     def analyze(self) -> List[Dict]:
         """Run complete compatibility analysis"""
@@ -131,20 +133,19 @@ class OpenStackCompatibilityAnalyzer:
         versions_file = self.repo_path / "helm-chart-versions.yaml"
         if versions_file.exists():
             try:
-                with open(versions_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    charts = data.get('charts', {})
-                    for component, version in charts.items():
-                        if any(x in component.lower() for x in ['keystone', 'nova', 'neutron', 'glance', 
-                                                                 'cinder', 'heat', 'barbican', 'placement',
-                                                                 'octavia', 'magnum', 'masakari', 'ceilometer',
-                                                                 'gnocchi', 'cloudkitty', 'ironic', 'designate',
-                                                                 'zaqar', 'blazar', 'freezer', 'horizon']):
-                            self.component_versions[component] = {
-                                'version': version,
-                                'source': str(versions_file.relative_to(self.repo_path)),
-                                'type': 'helm-chart'
-                            }
+                data = self.documents.load(versions_file)
+                charts = data.get('charts', {})
+                for component, version in charts.items():
+                    if any(x in component.lower() for x in ['keystone', 'nova', 'neutron', 'glance', 
+                                                             'cinder', 'heat', 'barbican', 'placement',
+                                                             'octavia', 'magnum', 'masakari', 'ceilometer',
+                                                             'gnocchi', 'cloudkitty', 'ironic', 'designate',
+                                                             'zaqar', 'blazar', 'freezer', 'horizon']):
+                        self.component_versions[component] = {
+                            'version': version,
+                            'source': str(versions_file.relative_to(self.repo_path)),
+                            'type': 'helm-chart'
+                        }
             except Exception as e:
                 pass
         
@@ -160,24 +161,23 @@ class OpenStackCompatibilityAnalyzer:
                 config_file = helm_configs / service / f"{service}-helm-overrides.yaml"
                 if config_file.exists():
                     try:
-                        with open(config_file, 'r') as f:
-                            content = f.read()
-                            # Extract version patterns like :2024.1-latest or :2025.1-latest
-                            matches = re.findall(rf'{service}_api.*?:(.+?)(?:["\s\n]|$)', content)
-                            for match in matches:
-                                if match and match.strip():
-                                    version_tag = match.strip()
-                                    # Extract release version (e.g., 2024.1 from 2024.1-latest)
-                                    release_match = re.search(r'(\d{4}\.\d)', version_tag)
-                                    if release_match:
-                                        if service not in self.component_versions:
-                                            self.component_versions[service] = {
-                                                'version': version_tag,
-                                                'source': str(config_file.relative_to(self.repo_path)),
-                                                'type': 'container-image',
-                                                'release': release_match.group(1)
-                                            }
-                                    break
+                        content = self.documents.read_text(config_file)
+                        # Extract version patterns like :2024.1-latest or :2025.1-latest
+                        matches = re.findall(rf'{service}_api.*?:(.+?)(?:["\s\n]|$)', content)
+                        for match in matches:
+                            if match and match.strip():
+                                version_tag = match.strip()
+                                # Extract release version (e.g., 2024.1 from 2024.1-latest)
+                                release_match = re.search(r'(\d{4}\.\d)', version_tag)
+                                if release_match:
+                                    if service not in self.component_versions:
+                                        self.component_versions[service] = {
+                                            'version': version_tag,
+                                            'source': str(config_file.relative_to(self.repo_path)),
+                                            'type': 'container-image',
+                                            'release': release_match.group(1)
+                                        }
+                                break
                     except Exception as e:
                         pass
     
@@ -365,16 +365,15 @@ class OpenStackCompatibilityAnalyzer:
         if manifests_dir.exists():
             for yaml_file in manifests_dir.rglob("*.yaml"):
                 try:
-                    with open(yaml_file, 'r') as f:
-                        for doc in yaml.safe_load_all(f):
-                            if doc and 'apiVersion' in doc:
-                                api_version = doc['apiVersion']
-                                if api_version in deprecated_apis:
-                                    found_deprecated.append({
-                                        'api': api_version,
-                                        'file': str(yaml_file.relative_to(self.repo_path)),
-                                        'removed_in': deprecated_apis[api_version]
-                                    })
+                    for doc in self.documents.load_all(yaml_file):
+                        if doc and 'apiVersion' in doc:
+                            api_version = doc['apiVersion']
+                            if api_version in deprecated_apis:
+                                found_deprecated.append({
+                                    'api': api_version,
+                                    'file': str(yaml_file.relative_to(self.repo_path)),
+                                    'removed_in': deprecated_apis[api_version]
+                                })
                 except Exception as e:
                     pass
         
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+OpenStack Git Mirrors
+Local bare, tree-less mirrors of the OpenStack service repositories. They hold
+the full commit graph and every tag but no trees or file contents, so they stay
+small, update incrementally with `git fetch`, and answer ancestry questions
+("which release tag is this commit based on?") exactly and without API calls.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+DEFAULT_MIRROR_DIR = Path("reports") / ".mirrors"
+
+# Where the mirrors are cloned from (<base>/<repo>.git)
+MIRROR_URL_BASE = os.getenv('OPENSTACK_MIRROR_BASE', "https://github.com/openstack")
+
+# Mirrors fetched less than this long ago are used as they are (seconds)
+MIRROR_MAX_AGE = 60 * 60
+
+MIRROR_TIMEOUT = 600  # seconds per clone / fetch
+DEFAULT_MIRROR_WORKERS = 4
+
+# Only branches and tags; GitHub's refs/pull/* would multiply the mirror size
+FETCH_REFSPECS = ['+refs/heads/*:refs/heads/*', '+refs/tags/*:refs/tags/*']
+
+US = '\x1f'
+
+
+def _git(repo_path: Union[str, Path], *args: str, timeout: Optional[float] = None) -> Optional[str]:
+    """Run a git command in repo_path, returning stdout or None if it fails"""
+    try:
+        result = subprocess.run(["git", *args], cwd=repo_path, capture_output=True, text=True,
+                                check=True, timeout=timeout)
+        return result.stdout
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return None
+
+
+class GitMirrors:
+    """One bare mirror per repository under mirror_dir, cloned on first use"""
+
+    def __init__(self, mirror_dir: Union[str, Path] = DEFAULT_MIRROR_DIR, url_base: str = MIRROR_URL_BASE,
+                 max_age: float = MIRROR_MAX_AGE):
+        self.mirror_dir = Path(mirror_dir)
+        self.url_base = url_base.rstrip('/')
+        self.max_age = max_age
+        self._checked = set()  # repos brought up to date by this process
+        self._fetched = set()  # repos actually cloned / fetched by this process
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def path(self, repo_name: str) -> Path:
+        return self.mirror_dir / f"{repo_name}.git"
+
+    def _repo_lock(self, repo_name: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(repo_name, threading.Lock())
+
+    def _age(self, repo_name: str) -> float:
+        """Seconds since the mirror was last cloned / fetched"""
+        path = self.path(repo_name)
+        stamp = path / "FETCH_HEAD" if (path / "FETCH_HEAD").exists() else path / "HEAD"
+        try:
+            return time.time() - stamp.stat().st_mtime
+        except OSError:
+            return float('inf')
+
+    def update(self, repo_name: str, force: bool = False) -> bool:
+        """Clone the mirror, or fetch what is new if it is older than max_age; False if unavailable"""
+        with self._repo_lock(repo_name):
+            path = self.path(repo_name)
+            if not (path / "HEAD").exists():
+                self.mirror_dir.mkdir(parents=True, exist_ok=True)
+                print(f"Cloning mirror of {repo_name}...")
+                if _git(self.mirror_dir, "clone", "--bare", "--filter=tree:0", "--no-tags",
+                        f"{self.url_base}/{repo_name}.git", path.name, timeout=MIRROR_TIMEOUT) is None:
+                    print(f"⚠️  Could not clone mirror of {repo_name}")
+                    return False
+                _git(path, "config", "--unset-all", "remote.origin.fetch")
+                for refspec in FETCH_REFSPECS:
+                    _git(path, "config", "--add", "remote.origin.fetch", refspec)
+                force = True
+            elif repo_name in self._checked and not force:
+                return True
+            if force or self._age(repo_name) > self.max_age:
+                if _git(path, "fetch", "--prune", "--quiet", "origin", timeout=MIRROR_TIMEOUT) is None:
+                    print(f"⚠️  Could not fetch mirror of {repo_name}, using it as it is")
+                self._fetched.add(repo_name)
+            self._checked.add(repo_name)
+            return True
+
+    def update_all(self, repo_names: Iterable[str], workers: int = DEFAULT_MIRROR_WORKERS) -> Dict[str, bool]:
+        """update() several mirrors concurrently; repo name -> available"""
+        names = list(dict.fromkeys(repo_names))
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(workers, len(names))) as executor:
+            return dict(zip(names, executor.map(self.update, names)))
+
+    def resolve(self, repo_name: str, sha: str) -> Optional[str]:
+        """Full SHA of a (possibly abbreviated) commit; an unknown sha fetches the mirror (once per run)"""
+        for attempt in range(2):
+            out = _git(self.path(repo_name), "rev-parse", "--verify", "--quiet", f"{sha}^{{commit}}")
+            if out:
+                return out.strip()
+            if attempt or repo_name in self._fetched or not self.update(repo_name, force=True):
+                break
+        return None
+
+    def commit(self, repo_name: str, sha: str) -> Optional[Dict[str, Union[str, List[str]]]]:
+        """sha, author date (ISO 8601) and parents of a commit in the mirror"""
+        full_sha = self.resolve(repo_name, sha)
+        if not full_sha:
+            return None
+        out = _git(self.path(repo_name), "show", "-s", f"--format=%H{US}%aI{US}%P", full_sha)
+        if not out:
+            return None
+        full_sha, date, parents = out.strip('\n').split(US)
+        return {'sha': full_sha, 'date': date, 'parents': parents.split()}
+
+    def is_ancestor(self, repo_name: str, ancestor: str, descendant: str) -> bool:
+        try:
+            return subprocess.run(["git", "merge-base", "--is-ancestor", ancestor, descendant],
+                                  cwd=self.path(repo_name), capture_output=True).returncode == 0
+        except OSError:
+            return False
+
+    def base_tag(self, repo_name: str, sha: str) -> Optional[str]:
+        """Nearest tag reachable from sha (the release the commit is built on)"""
+        out = _git(self.path(repo_name), "describe", "--tags", "--abbrev=0", sha)
+        return out.strip() if out else None
+
+    def tags(self, repo_name: str) -> List[Dict[str, str]]:
+        """Every tag with the sha and author date of the commit it points at, newest first"""
+        out = _git(self.path(repo_name), "for-each-ref", "--sort=-creatordate",
+                   f"--format=%(refname:lstrip=2){US}%(objectname){US}%(*objectname){US}"
+                   f"%(authordate:iso-strict){US}%(*authordate:iso-strict)", "refs/tags")
+        tags = []
+        for line in (out or "").splitlines():
+            name, sha, peeled_sha, date, peeled_date = line.split(US)
+            tags.append({'name': name, 'sha': peeled_sha or sha, 'date': peeled_date or date})
+        return tags
@@ -7,20 +7,39 @@ Works with Component Inventory Table.
 
 import os
 import re
+import bisect
 import json
 import yaml
 import csv
 import requests
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from collections import defaultdict
-import time
+
+from openstack_git_mirrors import DEFAULT_MIRROR_DIR, GitMirrors
+from upstream_cache import DEFAULT_CACHE_FILE, NEVER_EXPIRES, UpstreamCache
+from upstream_client import HIGH_PRIORITY, UpstreamClient
 
 # GitHub API base URLs
 GITHUB_API_BASE = "https://api.github.com"
 OPENSTACK_ORG = "openstack"
 
+# GraphQL endpoint (override to point at GitHub Enterprise or a local mock server)
+GITHUB_GRAPHQL_URL = os.getenv('GITHUB_GRAPHQL_URL', f"{GITHUB_API_BASE}/graphql")
+
+# Aliased repository lookups per GraphQL query, and tags fetched per repository per page (API max 100)
+GRAPHQL_BATCH_SIZE = 25
+GRAPHQL_TAGS_PER_PAGE = 100
+
+GRAPHQL_COMMIT_FIELDS = "oid url author { date }"
+
+# Tag pages are revalidated (If-None-Match -> 304, free of rate limit) once older than this;
+# commits never change and stay cached forever, "not found" answers for a day
+TAG_CACHE_TTL = 10 * 60
+MISSING_COMMIT_TTL = 24 * 60 * 60
+TAGS_PER_PAGE = 100  # GitHub's maximum
+
 # OpenStack release train mapping (as specified by user)
 RELEASE_TRAIN_MAPPING = {
     "2025.1": "Caracal",
@@ -55,17 +74,141 @@ COMPONENT_REPOS = {
     'skyline': 'skyline',
 }
 
+def _tag_date(tag: Dict) -> str:
+    return tag.get('commit', {}).get('commit', {}).get('author', {}).get('date', '') or ''
+
+
+class TagIndex:
+    """A service's tags in parallel arrays sorted by commit date, for bisect lookups.
+
+    Ties keep the API order (the first listed tag wins), like the sorted() scans this
+    replaces; tags without a date sort first and are never returned by before().
+    """
+
+    def __init__(self, tags: List[Dict], release_train: Callable[[str], Optional[str]]):
+        self.source = tags  # the list this was built from, to notice a refetch
+        order = sorted(range(len(tags)), key=lambda i: (_tag_date(tags[i]), -i))
+        self.tags = [tags[i] for i in order]
+        self.dates = [_tag_date(tag) for tag in self.tags]
+        self.trains = [release_train(tag.get('name', '').lstrip('v')) for tag in self.tags]
+        self.dated_from = bisect.bisect_right(self.dates, '')
+
+        # First tag (in API order) per commit sha / name; shas sorted for prefix lookups
+        self.by_sha = {}
+        self.by_name = {}
+        for i, tag in enumerate(tags):
+            sha = tag.get('commit', {}).get('sha', '')
+            if sha:
+                self.by_sha.setdefault(sha, (i, tag))
+            self.by_name.setdefault(tag.get('name'), tag)
+        self.sorted_shas = sorted(self.by_sha)
+
+        # Newest tag per release train (lower-cased train name)
+        self.latest_by_train = {}
+        for tag, train in zip(self.tags, self.trains):
+            if train:
+                self.latest_by_train[train.lower()] = tag
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def for_commit(self, sha: str, full_sha: Optional[str] = None) -> Optional[Dict]:
+        """Tag pointing at sha (any sha prefix) or at full_sha"""
+        if not sha:
+            return None
+        matches = []
+        i = bisect.bisect_left(self.sorted_shas, sha)
+        while i < len(self.sorted_shas) and self.sorted_shas[i].startswith(sha):
+            matches.append(self.by_sha[self.sorted_shas[i]])
+            i += 1
+        if full_sha and full_sha in self.by_sha:
+            matches.append(self.by_sha[full_sha])
+        return min(matches, key=lambda match: match[0])[1] if matches else None
+
+    def before(self, date: str) -> Iterator[Dict]:
+        """Dated tags at or before date (ISO 8601), newest first"""
+        for i in range(bisect.bisect_right(self.dates, date) - 1, self.dated_from - 1, -1):
+            yield self.tags[i]
+
+    def latest(self, release_train: Optional[str] = None) -> Optional[Dict]:
+        """Newest tag overall, or of one release train"""
+        if release_train is not None:
+            return self.latest_by_train.get(release_train.lower())
+        return self.tags[-1] if self.tags else None
+
+
 class OpenStackGitHubVersionResolver:
-    def __init__(self, repo_path: str = "/root/genestack", github_token: Optional[str] = None):
+    def __init__(self, repo_path: str = "/root/genestack", github_token: Optional[str] = None,
+                 graphql_url: Optional[str] = None, mirror_dir: Optional[str] = None,
+                 cache_file: Optional[str] = None):
         self.repo_path = Path(repo_path)
         self.github_token = github_token or os.getenv('GITHUB_TOKEN')
+        self.graphql_url = graphql_url or GITHUB_GRAPHQL_URL
+        # GitHub's GraphQL API needs a token; a custom endpoint (mock server) may not
+        self.use_graphql = bool(self.github_token) or self.graphql_url != f"{GITHUB_API_BASE}/graphql"
         self.session = requests.Session()
         if self.github_token:
             self.session.headers.update({'Authorization': f'token {self.github_token}'})
         self.session.headers.update({'Accept': 'application/vnd.github.v3+json'})
         self.version_cache = {}
         self.tag_cache = {}
+        self.tag_index_cache = {}
         self.commit_cache = {}
+        # REST responses persist across runs (with their ETags) in the upstream cache
+        self.cache_file = Path(cache_file) if cache_file else self.repo_path / DEFAULT_CACHE_FILE
+        self._upstream = None
+        # Local bare mirrors answer commits, tags and ancestry exactly, without API calls
+        # ("" keeps them in the default directory under repo_path, like the cache)
+        if mirror_dir is None:
+            self.mirrors = None
+        else:
+            self.mirrors = GitMirrors(Path(mirror_dir) if mirror_dir else self.repo_path / DEFAULT_MIRROR_DIR)
+        self.mirror_available = {}
+
+    @property
+    def upstream(self) -> UpstreamClient:
+        """Cached, rate-limited client for the REST API, created on first use"""
+        if self._upstream is None:
+            try:
+                cache = UpstreamCache(self.cache_file)
+            except Exception as e:
+                print(f"Warning: upstream cache {self.cache_file} unavailable ({e}), results will not be cached.")
+                cache = None
+            self._upstream = UpstreamClient(concurrency=1, timeout=10, cache=cache)
+            self._upstream.session.headers.update(self.session.headers)
+        return self._upstream
+
+    def _mirror_repo(self, service_name: str) -> Optional[str]:
+        """Repo name of service_name if it can be answered from a local mirror"""
+        if self.mirrors is None:
+            return None
+        repo_name = COMPONENT_REPOS.get(service_name.lower())
+        if not repo_name:
+            return None
+        if repo_name not in self.mirror_available:
+            self.mirror_available[repo_name] = self.mirrors.update(repo_name)
+        return repo_name if self.mirror_available[repo_name] else None
+
+    @staticmethod
+    def _trim_commit(data: Dict) -> Dict:
+        """The fields of a REST commit response used here (the full one carries every patch)"""
+        return {
+            'sha': data.get('sha', ''),
+            'html_url': data.get('html_url', ''),
+            'commit': {'author': {'date': data.get('commit', {}).get('author', {}).get('date', '')}},
+            'parents': [{'sha': p.get('sha', ''), 'html_url': p.get('html_url', '')}
+                        for p in data.get('parents', [])],
+        }
+
+    @staticmethod
+    def _github_commit(repo_name: str, sha: str, date: str = '', parents: Optional[List[str]] = None) -> Dict:
+        """Commit in the shape of the REST commits API (the fields used here)"""
+        html_url = f"https://github.com/{OPENSTACK_ORG}/{repo_name}/commit/{sha}"
+        commit = {'sha': sha, 'html_url': html_url, 'commit': {'author': {'date': date}}}
+        if parents is not None:
+            commit['parents'] = [{'sha': p, 'html_url': f"https://github.com/{OPENSTACK_ORG}/{repo_name}/commit/{p}"}
+                                 for p in parents]
+        return commit
         
     def extract_sha_from_version(self, version: str) -> Optional[str]:
         """Extract commit SHA from version string using specified pattern"""
@@ -92,29 +235,22 @@ class OpenStackGitHubVersionResolver:
         repo_name = COMPONENT_REPOS.get(service_name.lower())
         if not repo_name:
             return None
+
+        if self._mirror_repo(service_name):
+            info = self.mirrors.commit(repo_name, sha)
+            commit_data = self._github_commit(repo_name, info['sha'], info['date'], info['parents']) if info else None
+            self.commit_cache[cache_key] = commit_data
+            return commit_data
         
         url = f"{GITHUB_API_BASE}/repos/{OPENSTACK_ORG}/{repo_name}/commits/{sha}"
         
         try:
-            response = self.session.get(url, timeout=10)
-            
-            # Handle rate limiting - wait and retry
-            if response.status_code == 403:
-                retry_after = int(response.headers.get('Retry-After', 60))
-                print(f"⚠️  Rate limit hit, waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                commit_data = response.json()
-                self.commit_cache[cache_key] = commit_data
-                # Rate limiting: 60 requests/hour = ~1 request per minute
-                time.sleep(1)
-                return commit_data
-            elif response.status_code == 404:
-                # Commit not found
-                self.commit_cache[cache_key] = None
-                return None
+            # Rate limiting (and waiting out a 403) is done by the upstream client
+            commit_data = self.upstream.get_cached(url, f"github:{repo_name}:commit:{sha}",
+                                                   lambda response: self._trim_commit(response.json()),
+                                                   ttl=NEVER_EXPIRES, miss_ttl=MISSING_COMMIT_TTL)
+            self.commit_cache[cache_key] = commit_data
+            return commit_data
         except Exception as e:
             print(f"Error querying commit {sha} for {service_name}: {e}")
         
@@ -128,28 +264,27 @@ class OpenStackGitHubVersionResolver:
         repo_name = COMPONENT_REPOS.get(service_name.lower())
         if not repo_name:
             return []
+
+        if self._mirror_repo(service_name):
+            tags = [{'name': tag['name'], 'commit': self._github_commit(repo_name, tag['sha'], tag['date'])}
+                    for tag in self.mirrors.tags(repo_name)]
+            self.tag_cache[service_name] = tags
+            return tags
         
         url = f"{GITHUB_API_BASE}/repos/{OPENSTACK_ORG}/{repo_name}/tags"
         tags = []
         page = 1
-        per_page = 200
+        per_page = TAGS_PER_PAGE
         
         try:
             while True:
+                # Each page is cached with its ETag; unchanged pages come back as free 304s
                 params = {'page': page, 'per_page': per_page}
-                response = self.session.get(url, params=params, timeout=10)
-                
-                # Handle rate limiting - wait and retry
-                if response.status_code == 403:
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    print(f"⚠️  Rate limit hit, waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
-                    response = self.session.get(url, params=params, timeout=10)
-                
-                if response.status_code != 200:
-                    break
-                
-                page_tags = response.json()
+                page_tags = self.upstream.get_cached(
+                    url, f"github:{repo_name}:tags:{per_page}:{page}",
+                    lambda response: [{'name': tag.get('name', ''), 'commit': tag.get('commit', {})}
+                                      for tag in response.json()],
+                    ttl=TAG_CACHE_TTL, params=params)
                 if not page_tags:
                     break
                 
@@ -160,8 +295,6 @@ class OpenStackGitHubVersionResolver:
                     break
                 
                 page += 1
-                # Rate limiting: 60 requests/hour = ~1 request per minute (conservative)
-                time.sleep(1)
         
         except Exception as e:
             print(f"Error fetching tags for {service_name}: {e}")
@@ -169,6 +302,149 @@ class OpenStackGitHubVersionResolver:
         self.tag_cache[service_name] = tags
         return tags
     
+    def graphql(self, query: str) -> Optional[Dict]:
+        """Run one GraphQL query; returns its data, or None if the request failed"""
+        try:
+            response = self.upstream.post(self.graphql_url, json={'query': query}, timeout=30)
+            if response.status_code != 200:
+                print(f"⚠️  GraphQL request failed with HTTP {response.status_code}")
+                return None
+            payload = response.json()
+        except Exception as e:
+            print(f"Error querying GitHub GraphQL API: {e}")
+            return None
+        for error in payload.get('errors') or []:
+            # Unknown commits / repos come back as NOT_FOUND errors next to null data
+            if error.get('type') != 'NOT_FOUND':
+                print(f"⚠️  GraphQL error: {error.get('message')}")
+        return payload.get('data')
+
+    @staticmethod
+    def _repo_query(alias: str, repo_name: str, body: str) -> str:
+        return (f'{alias}: repository(owner: {json.dumps(OPENSTACK_ORG)}, name: {json.dumps(repo_name)}) '
+                f'{{ {body} }}')
+
+    @staticmethod
+    def _rest_commit(node: Dict) -> Dict:
+        """GraphQL Commit node in the shape of the REST commits API (the fields used here)"""
+        commit = {
+            'sha': node['oid'],
+            'html_url': node.get('url', ''),
+            'commit': {'author': {'date': (node.get('author') or {}).get('date', '')}},
+        }
+        if 'parents' in node:
+            commit['parents'] = [{'sha': p['oid'], 'html_url': p.get('url', '')}
+                                 for p in (node['parents'] or {}).get('nodes') or []]
+        return commit
+
+    def prefetch_commits(self, lookups: List[Tuple[str, str]]) -> int:
+        """Fetch many (service, sha) commits into the commit cache with a few aliased GraphQL queries.
+
+        Returns how many lookups were answered; the rest are left to get_commit_info().
+        """
+        pending = []
+        for service_name, sha in dict.fromkeys(lookups):
+            repo_name = COMPONENT_REPOS.get(service_name.lower())
+            if repo_name and sha and len(sha) >= 7 and f"{service_name}:{sha}" not in self.commit_cache:
+                pending.append((service_name, sha, repo_name))
+
+        # Commits fetched by earlier runs (REST or GraphQL) never change
+        cache = self.upstream.cache
+        if cache is not None:
+            remaining = []
+            for service_name, sha, repo_name in pending:
+                entry = cache.get(f"github:{repo_name}:commit:{sha}")
+                if entry is not None and entry.value is not None:
+                    self.commit_cache[f"{service_name}:{sha}"] = entry.value
+                    # Ancestry checks look commits up by their full sha
+                    self.commit_cache[f"{service_name}:{entry.value['sha']}"] = entry.value
+                else:
+                    remaining.append((service_name, sha, repo_name))
+            pending = remaining
+
+        answered = 0
+        for start in range(0, len(pending), GRAPHQL_BATCH_SIZE):
+            batch = pending[start:start + GRAPHQL_BATCH_SIZE]
+            query = "query { " + " ".join(
+                self._repo_query(f"c{i}", repo_name,
+                                 f'object(expression: {json.dumps(sha)}) {{ ... on Commit {{ '
+                                 f'{GRAPHQL_COMMIT_FIELDS} parents(first: 10) {{ nodes {{ oid url }} }} }} }}')
+                for i, (_, sha, repo_name) in enumerate(batch)) + " }"
+            data = self.graphql(query)
+            if data is None:
+                continue
+            for i, (service_name, sha, repo_name) in enumerate(batch):
+                if f"c{i}" not in data:
+                    continue
+                node = (data[f"c{i}"] or {}).get('object')
+                commit = self._rest_commit(node) if node and node.get('oid') else None
+                # Missing commits are cached as None, like a REST 404
+                self.commit_cache[f"{service_name}:{sha}"] = commit
+                if commit:
+                    self.commit_cache[f"{service_name}:{commit['sha']}"] = commit
+                    if cache is not None:
+                        cache.put(f"github:{repo_name}:commit:{sha}", commit, ttl=NEVER_EXPIRES)
+                answered += 1
+        return answered
+
+    def prefetch_tags(self, service_names: List[str]) -> int:
+        """Fetch every tag (with its commit and date) of many services into the tag cache.
+
+        Repositories are batched into aliased queries and paged together; returns how
+        many services were fetched completely.
+        """
+        cursors = {}
+        for service_name in dict.fromkeys(service_names):
+            repo_name = COMPONENT_REPOS.get(service_name.lower())
+            if repo_name and service_name not in self.tag_cache:
+                cursors[service_name] = None
+        tags = {service_name: [] for service_name in cursors}
+        fetched = 0
+
+        target = (f"target {{ ... on Commit {{ {GRAPHQL_COMMIT_FIELDS} }} "
+                  f"... on Tag {{ target {{ ... on Commit {{ {GRAPHQL_COMMIT_FIELDS} }} }} }} }}")
+        while cursors:
+            batch = list(cursors)[:GRAPHQL_BATCH_SIZE]
+            parts = []
+            for i, service_name in enumerate(batch):
+                after = f", after: {json.dumps(cursors[service_name])}" if cursors[service_name] else ""
+                parts.append(self._repo_query(
+                    f"t{i}", COMPONENT_REPOS[service_name.lower()],
+                    f'refs(refPrefix: "refs/tags/", first: {GRAPHQL_TAGS_PER_PAGE}{after}, '
+                    f'orderBy: {{field: TAG_COMMIT_DATE, direction: DESC}}) '
+                    f'{{ pageInfo {{ hasNextPage endCursor }} nodes {{ name {target} }} }}'))
+            data = self.graphql("query { " + " ".join(parts) + " }")
+            for i, service_name in enumerate(batch):
+                refs = ((data or {}).get(f"t{i}") or {}).get('refs')
+                if refs is None:
+                    # Leave it to the REST path
+                    del cursors[service_name]
+                    continue
+                for node in refs.get('nodes') or []:
+                    commit = node.get('target') or {}
+                    if 'oid' not in commit:
+                        commit = commit.get('target') or {}  # annotated tag
+                    if commit.get('oid'):
+                        rest_commit = self._rest_commit(commit)
+                        tags[service_name].append({'name': node['name'], 'commit': rest_commit})
+                page = refs.get('pageInfo') or {}
+                if page.get('hasNextPage') and page.get('endCursor'):
+                    cursors[service_name] = page['endCursor']
+                else:
+                    del cursors[service_name]
+                    self.tag_cache[service_name] = tags[service_name]
+                    fetched += 1
+        return fetched
+
+    def get_tag_index(self, service_name: str) -> TagIndex:
+        """TagIndex over get_all_tags(service_name), built once per service"""
+        tags = self.get_all_tags(service_name)
+        index = self.tag_index_cache.get(service_name)
+        if index is None or index.source is not tags:
+            index = TagIndex(tags, self.parse_release_train)
+            self.tag_index_cache[service_name] = index
+        return index
+
     def is_ancestor(self, commit_sha: str, tag_sha: str, service_name: str) -> bool:
         """Check if tag_sha is an ancestor of commit_sha"""
         # For now, we'll do a simple comparison
@@ -178,6 +454,10 @@ class OpenStackGitHubVersionResolver:
         
         if commit_sha.startswith(tag_sha) or tag_sha.startswith(commit_sha):
             return True
+
+        repo_name = self._mirror_repo(service_name)
+        if repo_name:
+            return self.mirrors.is_ancestor(repo_name, tag_sha, commit_sha)
         
         # Try to get commit info and check parents
         commit_info = self.get_commit_info(service_name, commit_sha)
@@ -193,9 +473,9 @@ class OpenStackGitHubVersionResolver:
     
     def find_ancestor_tag(self, service_name: str, commit_sha: str) -> Optional[Dict]:
         """Find tag whose commit SHA is ancestor of commit_sha"""
-        tags = self.get_all_tags(service_name)
+        index = self.get_tag_index(service_name)
         
-        if not tags:
+        if not index:
             return None
         
         # Get commit info to get full SHA
@@ -204,38 +484,32 @@ class OpenStackGitHubVersionResolver:
             return None
         
         full_commit_sha = commit_info.get('sha', commit_sha)
+
+        repo_name = self._mirror_repo(service_name)
+        if repo_name:
+            # Exact answer: the nearest tag reachable from the commit
+            tag_name = self.mirrors.base_tag(repo_name, full_commit_sha)
+            return index.by_name.get(tag_name) if tag_name else None
         
         # First, try exact match
-        for tag in tags:
-            tag_commit_sha = tag.get('commit', {}).get('sha', '')
-            if tag_commit_sha == full_commit_sha or tag_commit_sha.startswith(commit_sha) or commit_sha.startswith(tag_commit_sha[:len(commit_sha)]):
-                return tag
+        tag = index.for_commit(commit_sha, full_commit_sha)
+        if tag:
+            return tag
         
         # Then try to find ancestor by checking commit history
         # For simplicity, we'll find the most recent tag before this commit
         commit_date = commit_info.get('commit', {}).get('author', {}).get('date', '')
         
         if commit_date:
-            # Sort tags by date and find the most recent one before commit
-            sorted_tags = sorted(
-                tags,
-                key=lambda x: x.get('commit', {}).get('commit', {}).get('author', {}).get('date', ''),
-                reverse=True
-            )
-            
-            for tag in sorted_tags:
-                tag_date = tag.get('commit', {}).get('commit', {}).get('author', {}).get('date', '')
-                if tag_date and tag_date <= commit_date:
-                    # Check if it's an ancestor
-                    tag_sha = tag.get('commit', {}).get('sha', '')
-                    if self.is_ancestor(full_commit_sha, tag_sha, service_name):
-                        return tag
+            # Most recent tags before the commit first
+            for tag in index.before(commit_date):
+                # Check if it's an ancestor
+                tag_sha = tag.get('commit', {}).get('sha', '')
+                if self.is_ancestor(full_commit_sha, tag_sha, service_name):
+                    return tag
         
         # Fallback: return most recent tag
-        if tags:
-            return sorted(tags, key=lambda x: x.get('commit', {}).get('commit', {}).get('author', {}).get('date', ''), reverse=True)[0]
-        
-        return None
+        return index.latest()
     
     def parse_release_train(self, version: str) -> Optional[str]:
         """Parse major.minor into OpenStack release train"""
@@ -268,9 +542,9 @@ class OpenStackGitHubVersionResolver:
     
     def find_nearest_tag_for_release(self, service_name: str, target_release: str) -> Optional[str]:
         """Find nearest tag matching target release train"""
-        tags = self.get_all_tags(service_name)
+        index = self.get_tag_index(service_name)
         
-        if not tags:
+        if not index:
             return None
         
         # Find release key from train name
@@ -283,30 +557,47 @@ class OpenStackGitHubVersionResolver:
         if not target_release_key:
             return None
         
-        # Look for tags matching the release
-        matching_tags = []
-        for tag in tags:
-            tag_name = tag.get('name', '').lstrip('v')
-            parsed_train = self.parse_release_train(tag_name)
-            if parsed_train and parsed_train.lower() == target_release.lower():
-                matching_tags.append(tag)
-        
-        if matching_tags:
-            # Return the most recent matching tag
-            sorted_tags = sorted(
-                matching_tags,
-                key=lambda x: x.get('commit', {}).get('commit', {}).get('author', {}).get('date', ''),
-                reverse=True
-            )
-            return sorted_tags[0].get('name', '').lstrip('v')
-        
-        return None
+        # The most recent tag of the release (release trains are parsed once per index)
+        tag = index.latest(target_release)
+        return tag.get('name', '').lstrip('v') if tag else None
     
-    def resolve_component_inventory(self, inventory_table: List[Dict]) -> List[Dict]:
-        """Resolve versions for Component Inventory Table"""
-        print("Resolving versions from GitHub (public API, no authentication required)...")
-        print("Note: Using public API with 60 requests/hour limit. This may take a few minutes.")
-        
+    def resolve_component_inventory(self, inventory_table: List[Dict],
+                                    priority_components: Optional[List[str]] = None) -> List[Dict]:
+        """Resolve versions for Component Inventory Table
+
+        Rows of priority_components (e.g. the ones on screen) are looked up first, ahead
+        of any other upstream request queued in the process.
+        """
+        if self.mirrors is not None:
+            print(f"Resolving versions from local git mirrors in {self.mirrors.mirror_dir}...")
+            services = {row.get('Component', '').lower() for row in inventory_table}
+            repos = sorted({COMPONENT_REPOS[s] for s in services if s in COMPONENT_REPOS})
+            self.mirror_available.update(self.mirrors.update_all(repos))
+        elif self.use_graphql:
+            # Commits first, then tags of the services whose commits exist, a few queries each;
+            # anything GraphQL could not answer falls through to the REST calls below
+            print(f"Resolving versions from GitHub (batched GraphQL: {self.graphql_url})...")
+            lookups = []
+            for row in inventory_table:
+                sha = self.extract_sha_from_version(row.get('Version in Repo') or row.get('version', ''))
+                if sha:
+                    lookups.append((row.get('Component', '').lower(), sha))
+            self.prefetch_commits(lookups)
+            self.prefetch_tags([service for service, sha in lookups
+                                if self.commit_cache.get(f"{service}:{sha}")])
+        else:
+            print("Resolving versions from GitHub (public API, no authentication required)...")
+            print("Note: Using public API with 60 requests/hour limit. This may take a few minutes.")
+        
+        if priority_components:
+            wanted = {component.lower() for component in priority_components}
+            with self.upstream.scheduler.priority(HIGH_PRIORITY):
+                for row in inventory_table:
+                    service_name = row.get('Component', '').lower()
+                    sha = self.extract_sha_from_version(row.get('Version in Repo') or row.get('version', ''))
+                    if sha and service_name in wanted and self.get_commit_info(service_name, sha):
+                        self.find_ancestor_tag(service_name, sha)
+
         resolved = []
         errors = []
         
@@ -472,6 +763,12 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Resolve OpenStack versions from GitHub")
     parser.add_argument("--repo-path", default="/root/genestack", help="Path to repository")
     parser.add_argument("--github-token", help="GitHub token for API (optional, not required - public API works fine)")
+    parser.add_argument("--graphql-url", help="GitHub GraphQL endpoint for batched lookups "
+                                              "(default: $GITHUB_GRAPHQL_URL or api.github.com; used with a token)")
+    parser.add_argument("--mirror-dir", nargs="?", const="",
+                        help="Resolve ancestry from local bare git mirrors kept in this directory "
+                             f"(default when given without a value: <repo-path>/{DEFAULT_MIRROR_DIR})")
+    parser.add_argument("--cache-file", help="Cache of GitHub responses (default: reports/.cache/upstream-cache.sqlite)")
     parser.add_argument("--output-dir", help="Output directory (default: reports/YYYY-MM-DD)")
     parser.add_argument("--inventory-file", help="Path to Component Inventory CSV file (optional)")
     args = parser.parse_args()
@@ -507,7 +804,9 @@ if __name__ == "__main__":
     
     # Resolve versions from GitHub
     print("\nStep 2: Resolving versions from GitHub...")
-    resolver = OpenStackGitHubVersionResolver(repo_path=str(repo_path), github_token=args.github_token)
+    resolver = OpenStackGitHubVersionResolver(repo_path=str(repo_path), github_token=args.github_token,
+                                              graphql_url=args.graphql_url, mirror_dir=args.mirror_dir,
+                                              cache_file=args.cache_file)
     resolved = resolver.resolve_component_inventory(inventory_table)
     
     # Export
@@ -520,3 +819,8 @@ if __name__ == "__main__":
     
     print(f"\n✅ Resolved {len(resolved)} component versions from GitHub")
     print(f"📄 Reports exported to: {output_dir}")
+    upstream_summary = resolver.upstream.scheduler.summary()
+    if upstream_summary:
+        print("🌐 Upstream requests:")
+        for line in upstream_summary:
+            print(f"   - {line}")
@@ -10,7 +10,6 @@ import re
 import json
 import yaml
 import csv
-import requests
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -18,6 +17,9 @@ from collections import defaultdict
 from urllib.parse import urljoin
 import html
 
+from document_cache import get_document_cache
+from upstream_client import UpstreamClient
+
 try:
     from openstack_version_resolver import extract_version_from_chart_tag
     OPENSTACK_RESOLVER_AVAILABLE = True
@@ -67,6 +69,9 @@ class OpenStackRepoScanner:
         self.components = []
         self.release_counts = defaultdict(int)
         self.scraped_release_data = {}
+        self.documents = get_document_cache()
+        # releases.openstack.org is paced by the scheduler shared with every other upstream caller
+        self.upstream = UpstreamClient(concurrency=1, timeout=10)
         
     def scan_repository(self) -> List[Dict]:
         """Recursively scan repository for OpenStack component versions"""
@@ -105,33 +110,32 @@ class OpenStackRepoScanner:
     def _scan_file(self, file_path: Path):
         """Scan a single file for OpenStack component versions"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
+            content = self.documents.read_text(file_path)
+            lines = content.split('\n')
+            
+            # Scan for version patterns
+            for line_num, line in enumerate(lines, 1):
+                # Skip comments
+                if line.strip().startswith('#'):
+                    continue
                 
-                # Scan for version patterns
-                for line_num, line in enumerate(lines, 1):
-                    # Skip comments
-                    if line.strip().startswith('#'):
-                        continue
-                    
-                    # Check for component names
-                    for component, pattern in COMPONENT_PATTERNS.items():
-                        if re.search(pattern, line, re.IGNORECASE):
-                            version = self._extract_version_from_line(line, component)
-                            if version:
-                                context_start = max(0, line_num - 3)
-                                context_end = min(len(lines), line_num + 4)
-                                context = '\n'.join(lines[context_start:context_end])
-                                
-                                self.components.append({
-                                    'component': component,
-                                    'version_detected': version,
-                                    'source_file': str(file_path.relative_to(self.repo_path)),
-                                    'source_line': line_num,
-                                    'version_context': context,
-                                    'raw_line': line.strip()
-                                })
+                # Check for component names
+                for component, pattern in COMPONENT_PATTERNS.items():
+                    if re.search(pattern, line, re.IGNORECASE):
+                        version = self._extract_version_from_line(line, component)
+                        if version:
+                            context_start = max(0, line_num - 3)
+                            context_end = min(len(lines), line_num + 4)
+                            context = '\n'.join(lines[context_start:context_end])
+                            
+                            self.components.append({
+                                'component': component,
+                                'version_detected': version,
+                                'source_file': str(file_path.relative_to(self.repo_path)),
+                                'source_line': line_num,
+                                'version_context': context,
+                                'raw_line': line.strip()
+                            })
         except Exception as e:
             pass
     
@@ -329,7 +333,7 @@ class OpenStackRepoScanner:
         try:
             # Try to get main releases page
             url = "https://releases.openstack.org/"
-            response = requests.get(url, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
+            response = self.upstream.get(url, headers={'User-Agent': 'Mozilla/5.0'})
             
             if response.status_code == 200:
                 content = response.text
@@ -342,7 +346,7 @@ class OpenStackRepoScanner:
                         # Try to get detailed info for each release
                         release_url = f"https://releases.openstack.org/{release_key}/"
                         try:
-                            release_response = requests.get(release_url, timeout=5, headers={'User-Agent': 'Mozilla/5.0'})
+                            release_response = self.upstream.get(release_url, timeout=5, headers={'User-Agent': 'Mozilla/5.0'})
                             if release_response.status_code == 200:
                                 release_content = release_response.text
                                 # Extract component versions if available
@@ -6,10 +6,11 @@ Converts Helm chart tags into real OpenStack release names using official metada
 
 import re
 import json
-import requests
 from typing import Optional, Tuple
 from pathlib import Path
 
+from upstream_client import UpstreamClient
+
 # Official OpenStack releases metadata
 OPENSTACK_SERIES_URL = "https://releases.openstack.org/_releases/releases.json"
 
@@ -23,9 +24,10 @@ def load_openstack_series():
     if _SERIES_CACHE is not None:
         return _SERIES_CACHE
     
-    # Try to fetch from API (only once)
+    # Try to fetch from API (only once), paced with every other upstream caller
+    upstream = UpstreamClient(concurrency=1, timeout=10)
     try:
-        response = requests.get(OPENSTACK_SERIES_URL, timeout=10)
+        response = upstream.get(OPENSTACK_SERIES_URL)
         response.raise_for_status()
         data = response.json()
         
@@ -57,6 +59,8 @@ def load_openstack_series():
             "yoga": {"version": "2021.0", "name": "Yoga", "status": "EOL"},
         }
         return _SERIES_CACHE
+    finally:
+        upstream.close()
 
 
 def extract_version_from_chart_tag(tag: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Repository File Walker
+Walks a repository once and hands each file to every scanner interested in it.
+File contents and parsed YAML come from the shared document cache, so a file is
+read and parsed once no matter how many scanners (or analyzers) look at it.
+"""
+
+import os
+import yaml
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from document_cache import CachedDocument, DocumentCache, get_document_cache
+
+# Directories that never contain anything worth scanning
+SKIP_DIRS = {'.git'}
+
+
+def walk_order_key(rel_path: str) -> List[Tuple[int, str]]:
+    """Sort key that reproduces the walk order (a directory's files before its sub-directories)"""
+    parts = rel_path.split('/')
+    return [(1, d) for d in parts[:-1]] + [(0, parts[-1])]
+
+
+class RepoFile:
+    """A file visited by the walker, backed by the shared document cache"""
+
+    def __init__(self, repo_path: Path, rel_path: str, cache: Optional[DocumentCache] = None):
+        self.repo_path = repo_path
+        self.rel_path = rel_path
+        self.path = repo_path / rel_path
+        self.name = self.path.name
+        self._cache = cache or get_document_cache()
+        self._document = None
+
+    @property
+    def document(self) -> CachedDocument:
+        """Cached contents of the file (read from disk at most once)"""
+        if self._document is None:
+            self._document = self._cache.get(self.path)
+        return self._document
+
+    @property
+    def data(self) -> bytes:
+        """Raw file contents"""
+        return self.document.data
+
+    @property
+    def text(self) -> str:
+        """File contents decoded as UTF-8"""
+        return self.document.text
+
+    @property
+    def docs(self) -> List[Any]:
+        """All YAML documents in the file (empty if the file does not parse)"""
+        try:
+            return self.document.docs
+        except yaml.YAMLError:
+            return []
+
+    @property
+    def doc(self) -> Any:
+        """First YAML document, the equivalent of yaml.safe_load"""
+        docs = self.docs
+        return docs[0] if docs else None
+
+
+class FileScanner(NamedTuple):
+    """A per-file scanner: which files it wants and how it turns one into rows"""
+    name: str
+    root: str  # Sub-directory the scanner is confined to ("" for the whole repo)
+    wants: Callable[[str], bool]
+    scan: Callable[[RepoFile], List[Dict]]
+
+
+class RepoWalker:
+    """Single, deterministic walk over a repository"""
+
+    def __init__(self, repo_path: Path, skip_dirs: Optional[Iterable[str]] = None):
+        self.repo_path = Path(repo_path)
+        self.skip_dirs = set(SKIP_DIRS if skip_dirs is None else skip_dirs)
+
+    def iter_paths(self, root: str = "") -> Iterator[str]:
+        """Yield repo-relative POSIX paths of all files under root, in sorted order"""
+        top = self.repo_path / root if root else self.repo_path
+        if not top.is_dir():
+            return
+
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = sorted(d for d in dirnames if d not in self.skip_dirs)
+            rel_dir = Path(dirpath).relative_to(self.repo_path).as_posix()
+            for name in sorted(filenames):
+                yield name if rel_dir == '.' else f"{rel_dir}/{name}"
+
+    def is_walkable(self, rel_path: str) -> bool:
+        """Whether a full walk would visit rel_path"""
+        parts = rel_path.split('/')
+        if any(d in self.skip_dirs for d in parts[:-1]):
+            return False
+        return (self.repo_path / rel_path).is_file()
+
+    def wants(self, rel_path: str, scanners: List[FileScanner]) -> bool:
+        """Whether any of the scanners is interested in rel_path"""
+        return any(scanner.wants(rel_path) for scanner in scanners)
+
+    def dispatch(self, rel_path: str, scanners: List[FileScanner]) -> Dict[str, List[Dict]]:
+        """Run every interested scanner over one file, reading it at most once"""
+        results = {}
+        repo_file = None
+
+        for scanner in scanners:
+            if not scanner.wants(rel_path):
+                continue
+            if repo_file is None:
+                repo_file = RepoFile(self.repo_path, rel_path)
+            try:
+                rows = scanner.scan(repo_file)
+            except Exception:
+                rows = []
+            if rows:
+                results[scanner.name] = rows
+
+        return results
+
+    def candidate_paths(self, scanners: List[FileScanner]) -> Iterator[str]:
+        """Yield, in walk order, the paths at least one scanner is interested in"""
+        roots = {s.root for s in scanners}
+        root = next(iter(roots)) if len(roots) == 1 else ""
+
+        for rel_path in self.iter_paths(root):
+            if self.wants(rel_path, scanners):
+                yield rel_path
+
+    def walk(self, scanners: List[FileScanner]) -> Iterator[Tuple[str, Dict[str, List[Dict]]]]:
+        """Walk the repository once, yielding (rel_path, per-scanner rows) for each file"""
+        for rel_path in self.candidate_paths(scanners):
+            results = self.dispatch(rel_path, scanners)
+            if results:
+                yield rel_path, results
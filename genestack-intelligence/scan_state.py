@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Incremental Scan State
+Remembers the commit a scan ran against and the rows each file produced, so the
+next scan only revisits the files git reports as changed since then. Files in
+submodules are tracked against each submodule's own checked-out commit, since
+the superproject's diff and ls-files never look inside them.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+# Bump whenever the layout of the state file or of the stored rows changes
+STATE_VERSION = 2
+
+DEFAULT_STATE_FILE = Path("reports") / ".cache" / "version-inventory-state.json"
+
+
+def _git(repo_path: Path, *args: str) -> Optional[str]:
+    """Run a git command in repo_path, returning stdout or None if it fails"""
+    try:
+        result = subprocess.run(["git", *args], cwd=repo_path, capture_output=True,
+                                text=True, check=True)
+        return result.stdout
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+def _split_z(output: str) -> List[str]:
+    return [p for p in output.split('\0') if p]
+
+
+def head_commit(repo_path: Path) -> Optional[str]:
+    """SHA of HEAD, or None if repo_path is not a git checkout"""
+    out = _git(repo_path, "rev-parse", "--verify", "HEAD")
+    return out.strip() if out else None
+
+
+def submodule_commits(repo_path: Path) -> Dict[str, str]:
+    """Checked-out commit of every initialized submodule under repo_path (nested ones too), by path"""
+    commits = {}
+    for entry in _split_z(_git(repo_path, "ls-files", "-z", "--stage") or ""):
+        info, path = entry.split('\t', 1)
+        # Uninitialized submodules have no .git of their own; git would answer for the superproject
+        if not info.startswith('160000') or not (repo_path / path / ".git").exists():
+            continue
+        commit = head_commit(repo_path / path)
+        if commit:
+            commits[path] = commit
+            commits.update({f"{path}/{sub}": c for sub, c in submodule_commits(repo_path / path).items()})
+    return commits
+
+
+def changed_since(repo_path: Path, commit: str,
+                  submodules: Optional[Dict[str, str]] = None) -> Optional[Set[str]]:
+    """Tracked files that differ between commit and the working tree (None if commit is unknown)
+
+    submodules maps submodule paths to the commit their files are compared against.
+    """
+    out = _git(repo_path, "diff", "--name-only", "-z", "--no-renames", "--relative", commit, "--")
+    if out is None:
+        return None
+    changed = set(_split_z(out))
+    for path, sub_commit in (submodules or {}).items():
+        sub_changed = changed_since(repo_path / path, sub_commit)
+        if sub_changed is None:
+            return None
+        changed |= {f"{path}/{p}" for p in sub_changed}
+    return changed
+
+
+def tracked_files(repo_path: Path) -> List[str]:
+    return _split_z(_git(repo_path, "ls-files", "-z") or "")
+
+
+def untracked_files(repo_path: Path, submodules: Iterable[str] = ()) -> List[str]:
+    """Files git does not track (ignored ones included, since the walk visits them too)"""
+    files = _split_z(_git(repo_path, "ls-files", "-z", "--others") or "")
+    for path in submodules:
+        files.extend(f"{path}/{p}" for p in _split_z(_git(repo_path / path, "ls-files", "-z", "--others") or ""))
+    return files
+
+
+def _under(rel_path: str, directory: str) -> bool:
+    return rel_path.startswith(directory + '/')
+
+
+def file_stamp(path: Path) -> Optional[List[int]]:
+    """(mtime, size) of a file, used to spot changes git cannot tell us about"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class ScanState:
+    """Rows produced per file at a given commit (and submodule commits)"""
+
+    def __init__(self, commit: str, scanners: List[str], files: Dict[str, Dict[str, List[Dict]]],
+                 dirty: Optional[List[str]] = None, untracked: Optional[Dict[str, List[int]]] = None,
+                 submodules: Optional[Dict[str, str]] = None):
+        self.commit = commit
+        self.scanners = scanners
+        self.files = files          # rel_path -> {scanner name: rows}
+        self.dirty = dirty or []    # tracked files that had local changes when scanned
+        self.untracked = untracked or {}  # rel_path -> file_stamp for files git does not track
+        self.submodules = submodules or {}  # submodule path -> checked-out commit
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['ScanState']:
+        """Load a saved state, or None if it is missing, unreadable or from another version"""
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != STATE_VERSION:
+            return None
+        try:
+            return cls(data['commit'], data['scanners'], data['files'],
+                       data.get('dirty'), data.get('untracked'), data.get('submodules'))
+        except KeyError:
+            return None
+
+    def save(self, path: Path):
+        """Write the state atomically so an interrupted scan never leaves a torn file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'version': STATE_VERSION,
+                'commit': self.commit,
+                'scanners': self.scanners,
+                'files': self.files,
+                'dirty': self.dirty,
+                'untracked': self.untracked,
+                'submodules': self.submodules,
+            }, f, default=str)
+        os.replace(tmp_path, path)
+
+    def stale_files(self, repo_path: Path, untracked: Dict[str, List[int]],
+                    submodules: Dict[str, str]) -> Optional[Set[str]]:
+        """Files whose stored rows can no longer be trusted (None if a stored commit is gone)"""
+        kept = {p: c for p, c in self.submodules.items() if p in submodules}
+        changed = changed_since(repo_path, self.commit, kept)
+        if changed is None:
+            return None
+
+        stale = changed | set(self.dirty)
+        stale |= {p for p, stamp in untracked.items() if self.untracked.get(p) != stamp}
+        # Untracked files that have since been deleted or committed
+        stale |= set(self.untracked) - set(untracked)
+        # Submodules initialized since the last scan, and files of ones that went away
+        for path in submodules.keys() - kept.keys():
+            stale |= {f"{path}/{p}" for p in tracked_files(repo_path / path)}
+        for path in self.submodules.keys() - kept.keys():
+            stale |= {p for p in self.files if _under(p, path)}
+        return stale
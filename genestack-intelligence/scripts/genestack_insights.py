@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
-import json, datetime, requests
+import json, datetime, sys
 from pathlib import Path
 
+# Share the upstream client (and its GitHub rate limiting) with the other tools
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from upstream_client import UpstreamClient
+
 REPO="rackerlabs/genestack"
 OUT=Path("reports")/datetime.datetime.now().strftime("%Y-%m-%d")
 OUT.mkdir(parents=True, exist_ok=True)
 
+client = UpstreamClient(concurrency=1, timeout=10)
+
 def fetch(endpoint):
-    return requests.get(f"https://api.github.com/repos/{REPO}/{endpoint}").json()
+    return client.get(f"https://api.github.com/repos/{REPO}/{endpoint}").json()
 
 def main():
     c = fetch("contributors")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Persistent Upstream Cache
+SQLite-backed cache of values looked up from upstream services, shared by every
+scan and dashboard rerun. Entries remember the ETag / Last-Modified of the response
+they came from so stale entries can be revalidated cheaply, and can be served as-is
+when running offline.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+DEFAULT_CACHE_FILE = Path("reports") / ".cache" / "upstream-cache.sqlite"
+
+# How long a looked-up value is trusted before it is revalidated (seconds)
+DEFAULT_TTL = 24 * 60 * 60
+
+# Pass as ttl to keep an entry forever (immutable data such as commit metadata)
+NEVER_EXPIRES = None
+
+# Pass as ttl to use the cache's default_ttl
+USE_DEFAULT_TTL = object()
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    expires_at: Optional[float]
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers that revalidate this entry"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class UpstreamCache:
+    """Key/value cache of upstream lookups stored in a SQLite file"""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_FILE, default_ttl: Optional[float] = DEFAULT_TTL):
+        self.path = Path(path)
+        self.default_ttl = default_ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    value TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL
+                )
+            """)
+
+    def _expiry(self, ttl: Any) -> Optional[float]:
+        if ttl is USE_DEFAULT_TTL:
+            ttl = self.default_ttl
+        return None if ttl is None else time.time() + ttl
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Entry for key, fresh or not (check entry.fresh)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, etag, last_modified, fetched_at, expires_at FROM entries WHERE key = ?",
+                (key,)).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1], row[2], row[3], row[4])
+
+    def put(self, key: str, value: Any, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, ttl: Any = USE_DEFAULT_TTL):
+        """Store value; ttl is in seconds, NEVER_EXPIRES keeps it forever"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, etag, last_modified, fetched_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, json.dumps(value, default=str), etag, last_modified, time.time(), self._expiry(ttl)))
+
+    def touch(self, key: str, ttl: Any = USE_DEFAULT_TTL):
+        """Mark an entry as freshly revalidated (e.g. after a 304 Not Modified)"""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE entries SET fetched_at = ?, expires_at = ? WHERE key = ?",
+                               (time.time(), self._expiry(ttl), key))
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one key, or everything when no key is given"""
+        with self._lock, self._conn:
+            if key is None:
+                self._conn.execute("DELETE FROM entries")
+            else:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
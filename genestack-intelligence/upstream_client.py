@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Upstream HTTP Client
+One pooled requests session shared by every upstream lookup, paced by a token-bucket
+scheduler that every client in the process shares, so concurrent enrichment stays
+polite to GitHub, PyPI and friends. The scheduler follows the X-RateLimit-* headers
+hosts send back, serves higher-priority callers first, and reports its queue depth.
+"""
+
+import contextlib
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from upstream_cache import USE_DEFAULT_TTL, UpstreamCache
+
+DEFAULT_TIMEOUT = 5
+DEFAULT_CONCURRENCY = 8
+
+# Longest a request waits for its host (rate-limit reset, Retry-After) before giving up (seconds)
+MAX_WAIT = 60
+
+# Requests per second allowed against each host (hosts not listed use DEFAULT_RATE)
+DEFAULT_RATE = 5.0
+DEFAULT_RATE_LIMITS = {
+    "pypi.org": 10.0,
+    "releases.openstack.org": 5.0,
+    "api.github.com": 1.0,
+}
+
+# Once less than this share of a host's quota is left, the rest is spread evenly until it resets
+QUOTA_RESERVE = 0.5
+
+# Lower runs first: rows on screen, then bulk enrichment, then speculative prefetching
+HIGH_PRIORITY = 0
+NORMAL_PRIORITY = 10
+BACKGROUND_PRIORITY = 20
+
+
+class RateLimited(requests.RequestException):
+    """The host's rate limit would not allow the request within MAX_WAIT"""
+
+
+class _Bucket:
+    __slots__ = ('rate', 'tokens', 'updated', 'blocked_until', 'remaining', 'limit', 'reset',
+                 'sent', 'waited', 'peak_queue')
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.remaining = None
+        self.limit = None
+        self.reset = None  # monotonic time the host's quota resets
+        self.sent = 0  # requests let through
+        self.waited = 0.0  # seconds those requests spent waiting in total
+        self.peak_queue = 0
+
+
+class RateLimitScheduler:
+    """Per-host token buckets; waiting requests are served by priority, then arrival"""
+
+    def __init__(self, rate_limits: Optional[Dict[str, float]] = None, default_rate: float = DEFAULT_RATE,
+                 max_wait: float = MAX_WAIT):
+        self.rate_limits = dict(DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits)
+        self.default_rate = default_rate
+        self.max_wait = max_wait
+        self._buckets = {}
+        self._queues = {}
+        self._seq = itertools.count()
+        self._local = threading.local()
+        self._cond = threading.Condition()
+
+    def _configured_rate(self, host: str) -> float:
+        return self.rate_limits.get(host.split('/', 1)[0], self.default_rate)
+
+    def _bucket(self, host: str) -> _Bucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(self._configured_rate(host))
+        return bucket
+
+    def _pace(self, host: str, bucket: _Bucket, now: float) -> float:
+        """Requests per second for host right now, given what it last said about its quota"""
+        rate = self._configured_rate(host)
+        if bucket.reset is not None and now >= bucket.reset:
+            bucket.remaining = bucket.reset = None  # new window, quota unknown again
+        if bucket.remaining is not None and bucket.reset is not None and bucket.limit:
+            if bucket.remaining < bucket.limit * QUOTA_RESERVE:
+                rate = min(rate, bucket.remaining / max(bucket.reset - now, 1.0))
+        return rate
+
+    @contextlib.contextmanager
+    def priority(self, level: int) -> Iterator[None]:
+        """Run this thread's requests at level (see HIGH_PRIORITY etc.) inside the block"""
+        previous = getattr(self._local, 'priority', None)
+        self._local.priority = level
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def acquire(self, host: str, priority: Optional[int] = None, max_wait: Optional[float] = None):
+        """Block until a request to host may go out.
+
+        Raises RateLimited if the host is blocked (quota used up, Retry-After) for longer
+        than max_wait; waiting in line or for the pace is not limited.
+        """
+        if priority is None:
+            priority = getattr(self._local, 'priority', None)
+        entry = (NORMAL_PRIORITY if priority is None else priority, next(self._seq))
+        max_wait = self.max_wait if max_wait is None else max_wait
+        queued_at = time.monotonic()
+        with self._cond:
+            queue = self._queues.setdefault(host, [])
+            heapq.heappush(queue, entry)
+            bucket = self._bucket(host)
+            bucket.peak_queue = max(bucket.peak_queue, len(queue))
+            try:
+                while True:
+                    now = time.monotonic()
+                    bucket = self._bucket(host)
+                    bucket.rate = self._pace(host, bucket, now)
+                    if bucket.rate <= 0:
+                        if bucket.blocked_until <= now:
+                            bucket.sent += 1
+                            bucket.waited += now - queued_at
+                            break  # unlimited host
+                    else:
+                        bucket.tokens = min(1.0, bucket.tokens + (now - bucket.updated) * bucket.rate)
+                    bucket.updated = now
+
+                    if queue[0] == entry:
+                        if bucket.blocked_until - now > max_wait:
+                            raise RateLimited(f"{host} is rate limited for another "
+                                              f"{bucket.blocked_until - now:.0f}s")
+                        ready_at = max(bucket.blocked_until,
+                                       now if bucket.tokens >= 1 or bucket.rate <= 0
+                                       else now + (1 - bucket.tokens) / bucket.rate)
+                        if ready_at <= now:
+                            if bucket.rate > 0:
+                                bucket.tokens -= 1
+                            bucket.sent += 1
+                            bucket.waited += now - queued_at
+                            break
+                        self._cond.wait(ready_at - now)
+                    else:
+                        self._cond.wait()
+            finally:
+                queue.remove(entry)
+                heapq.heapify(queue)
+                self._cond.notify_all()
+
+    def observe(self, host: str, response: requests.Response):
+        """Adapt host's pace to the rate-limit headers of one of its responses"""
+        headers = response.headers
+        with self._cond:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            try:
+                if 'X-RateLimit-Remaining' in headers:
+                    bucket.remaining = int(headers['X-RateLimit-Remaining'])
+                    bucket.limit = int(headers.get('X-RateLimit-Limit', 0)) or bucket.limit
+                    if 'X-RateLimit-Reset' in headers:
+                        bucket.reset = now + max(float(headers['X-RateLimit-Reset']) - time.time(), 0.0)
+                    if bucket.remaining <= 0 and bucket.reset is not None:
+                        bucket.blocked_until = max(bucket.blocked_until, bucket.reset)
+                if 'Retry-After' in headers and response.status_code in (403, 429, 503):
+                    bucket.blocked_until = max(bucket.blocked_until, now + float(headers['Retry-After']))
+            except ValueError:
+                pass  # HTTP-date Retry-After etc.; the fixed pace still applies
+            self._cond.notify_all()
+
+    def queue_depth(self, host: Optional[str] = None) -> int:
+        """Requests currently waiting (for one host, or all of them)"""
+        with self._cond:
+            if host is not None:
+                return len(self._queues.get(host, ()))
+            return sum(len(queue) for queue in self._queues.values())
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host queue depth (now and at its peak), requests sent, time spent waiting,
+        current pace and last reported quota"""
+        with self._cond:
+            now = time.monotonic()
+            return {
+                host: {
+                    'queued': len(self._queues.get(host, ())),
+                    'peak_queue': bucket.peak_queue,
+                    'sent': bucket.sent,
+                    'waited': bucket.waited,
+                    'rate': bucket.rate,
+                    'remaining': bucket.remaining,
+                    'reset_in': None if bucket.reset is None else max(bucket.reset - now, 0.0),
+                    'blocked_for': max(bucket.blocked_until - now, 0.0),
+                }
+                for host, bucket in self._buckets.items()
+            }
+
+    def summary(self) -> List[str]:
+        """One line per host that was sent requests, for end-of-run reports"""
+        lines = []
+        for host, stat in sorted(self.stats().items()):
+            if not stat['sent']:
+                continue
+            line = (f"{host}: {stat['sent']} request(s), {stat['waited']:.1f}s waiting, "
+                    f"peak queue {stat['peak_queue']}")
+            if stat['remaining'] is not None:
+                line += f", {stat['remaining']} left in quota"
+            lines.append(line)
+        return lines
+
+
+_shared_scheduler = None
+_shared_lock = threading.Lock()
+
+
+def shared_scheduler() -> RateLimitScheduler:
+    """The scheduler every UpstreamClient without its own rate_limits uses"""
+    global _shared_scheduler
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = RateLimitScheduler()
+        return _shared_scheduler
+
+
+class UpstreamClient:
+    """Pooled, rate-limited HTTP client for upstream version lookups"""
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                 rate_limits: Optional[Dict[str, float]] = None, cache: Optional[UpstreamCache] = None,
+                 offline: bool = False, scheduler: Optional[RateLimitScheduler] = None):
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        # Persistent cache of looked-up values; offline mode answers from it only
+        self.cache = cache
+        self.offline = offline
+        # Custom rate limits get a scheduler of their own; otherwise pace with every other client
+        self.scheduler = scheduler or (RateLimitScheduler(rate_limits) if rate_limits is not None
+                                       else shared_scheduler())
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'genestack-intelligence'})
+        # Keep one connection per concurrent lookup alive instead of reconnecting each time
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @staticmethod
+    def rate_limited(response: requests.Response) -> bool:
+        """429, or GitHub's 403 with its request quota used up"""
+        return response.status_code == 429 or (
+            response.status_code == 403 and (response.headers.get('X-RateLimit-Remaining') == '0'
+                                             or 'Retry-After' in response.headers))
+
+    def request(self, method: str, url: str, priority: Optional[int] = None, **kwargs) -> requests.Response:
+        """Send a request through the shared session when the scheduler lets it go.
+
+        A rate-limited response is retried once, as soon as the host allows it again
+        (within MAX_WAIT); RateLimited is raised when the host will not allow it in time.
+        """
+        parsed = urlparse(url)
+        # GitHub meters its GraphQL API separately from REST
+        host = f"{parsed.netloc}/graphql" if parsed.path.endswith('/graphql') else parsed.netloc
+        kwargs.setdefault('timeout', self.timeout)
+        for attempt in range(2):
+            self.scheduler.acquire(host, priority)
+            response = self.session.request(method, url, **kwargs)
+            self.scheduler.observe(host, response)
+            if attempt or not self.rate_limited(response):
+                return response
+            print(f"⚠️  Rate limit hit on {host}, waiting for it to lift...")
+        return response
+
+    def get(self, url: str, priority: Optional[int] = None, **kwargs) -> requests.Response:
+        """GET url through the shared session once the host's rate limit allows it"""
+        return self.request('GET', url, priority, **kwargs)
+
+    def post(self, url: str, priority: Optional[int] = None, **kwargs) -> requests.Response:
+        return self.request('POST', url, priority, **kwargs)
+
+    def get_cached(self, url: str, key: str, parse: Callable[[requests.Response], Any],
+                   ttl: Any = USE_DEFAULT_TTL, miss_ttl: Any = USE_DEFAULT_TTL, **kwargs) -> Any:
+        """Value parsed from GET url, served from / stored in the persistent cache under key.
+
+        Fresh entries are returned without a request, stale ones are revalidated with
+        their ETag / Last-Modified, and if the upstream cannot be reached (or the client
+        is offline) whatever is cached is returned, however old. parse() is called for
+        200 responses; any other status caches None, kept for miss_ttl instead of ttl.
+        """
+        entry = self.cache.get(key) if self.cache is not None else None
+        if entry is not None and (entry.fresh or self.offline):
+            return entry.value
+        if self.offline:
+            return None
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            headers.update(entry.validators())
+
+        try:
+            response = self.get(url, headers=headers, **kwargs)
+        except requests.RequestException:
+            return entry.value if entry is not None else None
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(key, ttl=ttl)
+            return entry.value
+        if response.status_code >= 500 or self.rate_limited(response):
+            # Upstream trouble: keep serving what we had rather than caching a failure
+            return entry.value if entry is not None else None
+
+        value = parse(response) if response.status_code == 200 else None
+        if self.cache is not None:
+            self.cache.put(key, value, etag=response.headers.get('ETag'),
+                           last_modified=response.headers.get('Last-Modified'),
+                           ttl=ttl if response.status_code == 200 else miss_ttl)
+        return value
+
+    def close(self):
+        self.session.close()
+
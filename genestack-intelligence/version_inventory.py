@@ -7,14 +7,31 @@ Scans the entire repository for component versions and compares with upstream.
 import os
 import re
 import json
-import yaml
 import csv
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 import subprocess
-import requests
+import threading
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from inventory_row import InventoryRow, inventory_columns
+from inventory_writers import (CsvInventoryWriter, JsonLinesInventoryWriter, MarkdownInventoryWriter,
+                               stream_fieldnames)
+from repo_walker import FileScanner, RepoFile, RepoWalker, walk_order_key
+from scan_state import (DEFAULT_STATE_FILE, ScanState, changed_since, file_stamp, head_commit, submodule_commits,
+                        untracked_files)
+from upstream_cache import DEFAULT_CACHE_FILE, DEFAULT_TTL, UpstreamCache
+from upstream_client import DEFAULT_CONCURRENCY, HIGH_PRIORITY, NORMAL_PRIORITY, UpstreamClient
+
+# Optional: columnar (Parquet) inventory export
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 try:
     from openstack_version_resolver import extract_version_from_chart_tag, get_release_status
@@ -23,435 +40,610 @@ except ImportError:
     OPENSTACK_RESOLVER_AVAILABLE = False
     print("Warning: openstack_version_resolver not available. OpenStack version resolution will be skipped.")
 
+OPENSTACK_SERVICES = ['keystone', 'glance', 'nova', 'cinder', 'neutron', 'heat',
+                      'barbican', 'placement', 'octavia', 'magnum', 'masakari',
+                      'ceilometer', 'gnocchi', 'cloudkitty', 'ironic', 'designate',
+                      'zaqar', 'blazar', 'freezer', 'horizon']
+
+# Rows enriched at a time when streaming (see VersionInventory.iter_inventory)
+STREAM_BATCH_SIZE = 256
+
+# "key: name:tag" image references picked up from any YAML file. One pass finds the
+# keys, then the value is matched in place; each kind resumes after its own previous
+# match, exactly as a separate finditer per key would. "docker_image:" also contains
+# "image:", which has always produced an extra image row. ("imageTag:" values carry
+# no name:tag pair and never produced a row, so that key is not searched for.)
+GENERIC_IMAGE_KINDS = ['image', 'docker_image', 'containerImage']
+GENERIC_IMAGE_KEYS = re.compile(r'(?P<docker_image>docker_image:)|(?P<containerImage>containerImage:)|(?P<image>image:)')
+GENERIC_IMAGE_VALUE = re.compile(r'\s*(?P<name>.+?):(?P<tag>.+?)(?:\s|$)', re.MULTILINE)
+
+# Per-process scanner set used by the worker pool (see VersionInventory._scan_paths)
+_WORKER_WALKER = None
+_WORKER_SCANNERS = None
+
+
+def _init_scan_worker(inventory_cls, repo_path: str, scanner_names: List[str]):
+    """Build the scanners once per worker process"""
+    global _WORKER_WALKER, _WORKER_SCANNERS
+
+    inventory = inventory_cls(repo_path=repo_path)
+    _WORKER_WALKER = RepoWalker(inventory.repo_path)
+    _WORKER_SCANNERS = inventory._select_scanners(*scanner_names)
+
+
+def _scan_path_in_worker(rel_path: str) -> Dict[str, List[Dict]]:
+    return _WORKER_WALKER.dispatch(rel_path, _WORKER_SCANNERS)
+
+
 class VersionInventory:
-    def __init__(self, repo_path: str = "/root/genestack"):
+    def __init__(self, repo_path: str = "/root/genestack", incremental: bool = False,
+                 state_file: Optional[str] = None, workers: int = 1,
+                 concurrency: int = DEFAULT_CONCURRENCY, upstream: Optional[UpstreamClient] = None,
+                 cache_file: Optional[str] = None, cache_ttl: float = DEFAULT_TTL, offline: bool = False,
+                 priority_components: Optional[Iterable[str]] = None):
         self.repo_path = Path(repo_path)
         self.inventory = []
         self.version_cache = {}
+        # Upstream lookups run concurrently through one pooled, rate-limited session
+        self.concurrency = max(1, concurrency)
+        self._upstream = upstream
+        self._upstream_lock = threading.Lock()
+        # Looked-up versions persist across runs; offline mode only serves cached ones
+        self.cache_file = Path(cache_file) if cache_file else self.repo_path / DEFAULT_CACHE_FILE
+        self.cache_ttl = cache_ttl
+        self.offline = offline
+        # Components looked up first, ahead of other queued upstream requests (e.g. rows on screen)
+        self.priority_components = {c.lower() for c in priority_components or ()}
+        # Number of processes parsing files (0 = one per CPU)
+        self.workers = workers or os.cpu_count() or 1
+        # Incremental mode reuses the rows of files unchanged since the last scan
+        self.incremental = incremental
+        self.state_file = Path(state_file) if state_file else self.repo_path / DEFAULT_STATE_FILE
         
     def scan_all(self) -> List[Dict]:
         """Scan entire repository for versions"""
         print("Starting comprehensive version inventory scan...")
-        
-        # 1. Helm Charts
-        print("Scanning Helm charts...")
-        self.scan_helm_charts()
-        
-        # 2. Kustomize
-        print("Scanning Kustomize overlays...")
-        self.scan_kustomize()
-        
-        # 3. Container Images
-        print("Scanning container images...")
-        self.scan_container_images()
-        
-        # 4. OpenStack Components
-        print("Scanning OpenStack components...")
-        self.scan_openstack_components()
-        
-        # 5. Kubernetes Manifests
-        print("Scanning Kubernetes manifests...")
-        self.scan_kubernetes_manifests()
-        
-        # 6. Operators/CRDs
-        print("Scanning Operators/CRDs...")
-        self.scan_operators_crds()
-        
-        # 7. Python Packages
-        print("Scanning Python packages...")
-        self.scan_python_packages()
-        
-        # 8. Ansible Roles
-        print("Scanning Ansible roles...")
-        self.scan_ansible_roles()
-        
-        # 9. CI/CD Workflows
-        print("Scanning CI/CD workflows...")
-        self.scan_cicd_workflows()
-        
-        # 10. Generic Image Scanner
-        print("Scanning for generic image references...")
-        self.scan_generic_images()
-        
+
+        # 1-10. Every file-based scanner shares a single walk of the repository:
+        # Helm charts, Kustomize, container images, OpenStack components,
+        # Kubernetes manifests, Operators/CRDs, Python packages, Ansible roles,
+        # CI/CD workflows and generic image references
+        print("Walking repository (Helm, Kustomize, containers, OpenStack, manifests, CRDs, "
+              "Python, Ansible, CI/CD, generic images)...")
+        self._run_file_scanners(self._file_scanners(), incremental=self.incremental)
+
         # 11. Get latest versions
         print("Querying latest upstream versions...")
         self.enrich_with_latest_versions()
-        
+
         # 12. Enrich with OpenStack version information
         if OPENSTACK_RESOLVER_AVAILABLE:
             print("Enriching with OpenStack release information...")
             self.enrich_with_openstack_versions()
-        
+
         return self.inventory
-    
-    def scan_helm_charts(self):
-        """Scan Helm charts for versions"""
-        helm_configs = self.repo_path / "base-helm-configs"
-        if not helm_configs.exists():
-            return
-        
-        for chart_dir in helm_configs.iterdir():
-            if not chart_dir.is_dir():
-                continue
-            
-            chart_yaml = chart_dir / "Chart.yaml"
-            values_yaml = chart_dir / f"{chart_dir.name}-helm-overrides.yaml"
-            
-            version = None
-            app_version = None
-            
-            # Read Chart.yaml
-            if chart_yaml.exists():
+
+    def iter_inventory(self) -> Iterator[InventoryRow]:
+        """Yield enriched rows as the walk produces them, without keeping the inventory in memory.
+
+        Rows arrive file by file in walk order instead of grouped by scanner
+        (Kubernetes API versions, which are deduplicated across files, come last),
+        and Compatibility / Recommended Upstream are left out because they depend
+        on the majority release of the whole inventory.
+        """
+        scanners = self._file_scanners()
+        walker = RepoWalker(self.repo_path)
+        if self.incremental:
+            file_rows = self._collect_incremental(walker, scanners)
+            scanned = ((p, file_rows[p]) for p in sorted(file_rows, key=walk_order_key))
+        else:
+            scanned = self._iter_scan_paths(walker, walker.candidate_paths(scanners), scanners)
+
+        def scanned_rows() -> Iterator[InventoryRow]:
+            api_versions = []
+            for rel_path, results in scanned:
+                for name, rows in results.items():
+                    if name == "kubernetes-manifests":
+                        api_versions.extend(rows)
+                    else:
+                        yield from (InventoryRow.from_dict(row) for row in rows)
+            yield from (InventoryRow.from_dict(row) for row in self._dedupe_api_versions(api_versions))
+
+        # Enrich in small batches so upstream lookups still run concurrently
+        batch = []
+        for row in scanned_rows():
+            batch.append(row)
+            if len(batch) >= STREAM_BATCH_SIZE:
+                self._enrich_rows(batch)
+                yield from batch
+                batch = []
+        if batch:
+            self._enrich_rows(batch)
+            yield from batch
+
+    def _enrich_rows(self, rows: List[InventoryRow]):
+        """Per-row enrichment used by the streaming pipeline"""
+        self._fill_latest_versions(rows)
+        if OPENSTACK_RESOLVER_AVAILABLE:
+            for item in rows:
+                self._set_openstack_version_fields(item)
+
+    def _file_scanners(self) -> List[FileScanner]:
+        """Per-file scanners, in the order their rows appear in the inventory"""
+        return [
+            FileScanner("helm-charts", "base-helm-configs", self._wants_helm_chart, self._scan_helm_chart_file),
+            FileScanner("kustomize", "base-kustomize", self._wants_kustomization, self._scan_kustomization_file),
+            FileScanner("container-images", "Containerfiles", self._wants_containerfile, self._scan_containerfile),
+            FileScanner("openstack-charts", "", self._wants_helm_chart_versions, self._scan_helm_chart_versions_file),
+            FileScanner("openstack-images", "base-helm-configs", self._wants_openstack_overrides, self._scan_openstack_overrides_file),
+            FileScanner("kubernetes-manifests", "manifests", self._wants_manifest, self._scan_manifest_file),
+            FileScanner("operators-crds", "", self._wants_crd, self._scan_crd_file),
+            FileScanner("python-packages", "", self._wants_requirements, self._scan_requirements_file),
+            FileScanner("ansible-roles", "ansible/roles", self._wants_ansible_role_vars, self._scan_ansible_role_vars_file),
+            FileScanner("cicd-workflows", ".github/workflows", self._wants_workflow, self._scan_workflow_file),
+            FileScanner("generic-images", "", self._wants_generic_yaml, self._scan_generic_images_file),
+        ]
+
+    def _run_file_scanners(self, scanners: List[FileScanner], incremental: bool = False):
+        """Walk the repository once and collect rows from the given scanners"""
+        walker = RepoWalker(self.repo_path)
+        if incremental:
+            file_rows = self._collect_incremental(walker, scanners)
+        else:
+            file_rows = self._scan_paths(walker, walker.candidate_paths(scanners), scanners)
+
+        rows_by_scanner = defaultdict(list)
+        for rel_path in sorted(file_rows, key=walk_order_key):
+            for name, rows in file_rows[rel_path].items():
+                rows_by_scanner[name].extend(rows)
+
+        # Keep the report grouped by scanner regardless of walk order
+        for scanner in scanners:
+            rows = rows_by_scanner[scanner.name]
+            if scanner.name == "kubernetes-manifests":
+                rows = self._dedupe_api_versions(rows)
+            self.inventory.extend(InventoryRow.from_dict(row) for row in rows)
+
+    def _collect_incremental(self, walker: RepoWalker, scanners: List[FileScanner]) -> Dict[str, Dict[str, List[Dict]]]:
+        """Per-file rows, rescanning only files changed since the saved scan state"""
+        commit = head_commit(self.repo_path)
+        if commit is None:
+            print("Warning: not a git repository, running a full scan instead of an incremental one.")
+            return self._scan_paths(walker, walker.candidate_paths(scanners), scanners)
+
+        names = [s.name for s in scanners]
+        submodules = submodule_commits(self.repo_path)
+        untracked = {}
+        for rel_path in untracked_files(self.repo_path, submodules):
+            if walker.wants(rel_path, scanners):
+                stamp = file_stamp(self.repo_path / rel_path)
+                if stamp:
+                    untracked[rel_path] = stamp
+
+        state = ScanState.load(self.state_file)
+        stale = None
+        if state is not None and state.scanners == names:
+            stale = state.stale_files(self.repo_path, untracked, submodules)
+
+        if stale is None:
+            print("No usable scan state, running a full scan...")
+            file_rows = self._scan_paths(walker, walker.candidate_paths(scanners), scanners)
+        else:
+            file_rows = {p: rows for p, rows in state.files.items() if p not in stale}
+            changed = [p for p in sorted(stale) if walker.is_walkable(p)]
+            file_rows.update(self._scan_paths(walker, changed, scanners))
+            print(f"Incremental scan: rescanned {len(stale)} changed file(s) since {state.commit[:12]}")
+
+        try:
+            dirty = sorted(changed_since(self.repo_path, commit, submodules) or [])
+            ScanState(commit, names, file_rows, dirty, untracked, submodules).save(self.state_file)
+        except Exception as e:
+            print(f"Warning: could not save scan state to {self.state_file}: {e}")
+
+        return file_rows
+
+    def _scan_paths(self, walker: RepoWalker, paths: Iterable[str],
+                    scanners: List[FileScanner]) -> Dict[str, Dict[str, List[Dict]]]:
+        """Run the scanners over each path, spreading the parsing across worker processes"""
+        return dict(self._iter_scan_paths(walker, paths, scanners))
+
+    def _iter_scan_paths(self, walker: RepoWalker, paths: Iterable[str],
+                         scanners: List[FileScanner]) -> Iterator[Tuple[str, Dict[str, List[Dict]]]]:
+        """Yield (rel_path, per-scanner rows) for each path that produced rows, in path order"""
+        executor = None
+        results = None
+
+        if self.workers > 1:
+            paths = list(paths)
+            if len(paths) > 1:
+                names = [s.name for s in scanners]
+                chunksize = max(1, len(paths) // (self.workers * 4))
                 try:
-                    with open(chart_yaml, 'r') as f:
-                        chart_data = yaml.safe_load(f)
-                        version = chart_data.get('version')
-                        app_version = chart_data.get('appVersion')
+                    executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_scan_worker,
+                                                   initargs=(type(self), str(self.repo_path), names))
+                    # map() hands results back in input order, so the merge stays deterministic
+                    results = executor.map(_scan_path_in_worker, paths, chunksize=chunksize)
                 except Exception as e:
-                    pass
-            
-            # Read values.yaml for image tags
-            image_tags = []
-            if values_yaml.exists():
+                    print(f"Warning: parallel scan failed ({e}), falling back to a single process.")
+                    if executor is not None:
+                        executor.shutdown(cancel_futures=True)
+                    executor = None
+                    results = None
+
+        try:
+            if results is None:
+                for rel_path in paths:
+                    rows = walker.dispatch(rel_path, scanners)
+                    if rows:
+                        yield rel_path, rows
+            else:
+                done = 0
                 try:
-                    with open(values_yaml, 'r') as f:
-                        values_data = yaml.safe_load(f)
-                        image_tags = self._extract_image_tags_from_yaml(values_data)
+                    for rel_path, rows in zip(paths, results):
+                        done += 1
+                        if rows:
+                            yield rel_path, rows
                 except Exception as e:
-                    pass
-            
-            if version:
-                self.inventory.append({
-                    "Component": chart_dir.name,
-                    "Type": "helm-chart",
-                    "Version in Repo": version,
+                    # e.g. BrokenProcessPool when a worker is killed; finish the rest here
+                    print(f"Warning: parallel scan failed ({e}), scanning the remaining "
+                          f"{len(paths) - done} file(s) in a single process.")
+                    executor.shutdown(cancel_futures=True)
+                    executor = None
+                    for rel_path in paths[done:]:
+                        rows = walker.dispatch(rel_path, scanners)
+                        if rows:
+                            yield rel_path, rows
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def _select_scanners(self, *names: str) -> List[FileScanner]:
+        return [s for s in self._file_scanners() if s.name in names]
+
+    def scan_helm_charts(self):
+        """Scan Helm charts for versions"""
+        self._run_file_scanners(self._select_scanners("helm-charts"))
+
+    def _wants_helm_chart(self, rel_path: str) -> bool:
+        parts = rel_path.split('/')
+        return (len(parts) == 3 and parts[0] == "base-helm-configs" and
+                parts[2] in ("Chart.yaml", f"{parts[1]}-helm-overrides.yaml"))
+
+    def _scan_helm_chart_file(self, repo_file: RepoFile) -> List[Dict]:
+        chart_name = repo_file.rel_path.split('/')[1]
+        data = repo_file.doc
+
+        # Chart.yaml carries the chart version
+        if repo_file.name == "Chart.yaml":
+            version = data.get('version')
+            app_version = data.get('appVersion')
+            if not version:
+                return []
+            return [{
+                "Component": chart_name,
+                "Type": "helm-chart",
+                "Version in Repo": version,
+                "Latest Upstream Version": None,
+                "Source Path": repo_file.rel_path,
+                "Notes": f"appVersion: {app_version}" if app_version else "",
+                "Comments": ""  # Editable comments column
+            }]
+
+        # Helm overrides carry image tags, added as separate entries
+        return [{
+            "Component": f"{chart_name} (image)",
+            "Type": "container-image",
+            "Version in Repo": tag,
+            "Latest Upstream Version": None,
+            "Source Path": repo_file.rel_path,
+            "Notes": "Image tag from Helm values",
+            "Comments": ""
+        } for tag in self._extract_image_tags_from_yaml(data) if tag]
+
+    def scan_kustomize(self):
+        """Scan Kustomize overlays for versions"""
+        self._run_file_scanners(self._select_scanners("kustomize"))
+
+    def _wants_kustomization(self, rel_path: str) -> bool:
+        return rel_path.startswith("base-kustomize/") and rel_path.endswith("/kustomization.yaml")
+
+    def _scan_kustomization_file(self, repo_file: RepoFile) -> List[Dict]:
+        rows = []
+        kust_data = repo_file.doc
+
+        # Extract images
+        images = kust_data.get('images', [])
+        for img in images:
+            name = img.get('name', 'unknown')
+            new_tag = img.get('newTag') or img.get('newName', '').split(':')[-1] if ':' in img.get('newName', '') else None
+
+            if new_tag:
+                rows.append({
+                    "Component": name,
+                    "Type": "kustomize-image",
+                    "Version in Repo": new_tag,
                     "Latest Upstream Version": None,
-                    "Source Path": str(chart_yaml.relative_to(self.repo_path)),
-                    "Notes": f"appVersion: {app_version}" if app_version else "",
-                    "Comments": ""  # Editable comments column
+                    "Source Path": repo_file.rel_path,
+                    "Notes": "Kustomize image override",
+                    "Comments": ""
                 })
-            
-            # Add image tags as separate entries
-            for tag in image_tags:
-                if tag:
-                    self.inventory.append({
-                        "Component": f"{chart_dir.name} (image)",
-                        "Type": "container-image",
+        return rows
+
+    def scan_container_images(self):
+        """Scan Containerfiles/Dockerfiles for base images"""
+        self._run_file_scanners(self._select_scanners("container-images"))
+
+    def _wants_containerfile(self, rel_path: str) -> bool:
+        parts = rel_path.split('/')
+        return len(parts) == 2 and parts[0] == "Containerfiles"
+
+    def _scan_containerfile(self, repo_file: RepoFile) -> List[Dict]:
+        rows = []
+        for line in repo_file.text.splitlines():
+            if line.strip().startswith('FROM'):
+                match = re.search(r'FROM\s+(.+?):(.+?)(?:\s|$)', line)
+                if match:
+                    image = match.group(1)
+                    tag = match.group(2)
+                    rows.append({
+                        "Component": image.split('/')[-1],
+                        "Type": "container-base-image",
                         "Version in Repo": tag,
                         "Latest Upstream Version": None,
-                        "Source Path": str(values_yaml.relative_to(self.repo_path)),
-                        "Notes": "Image tag from Helm values",
+                        "Source Path": repo_file.rel_path,
+                        "Notes": f"Base image: {image}",
                         "Comments": ""
                     })
-    
-    def scan_kustomize(self):
-        """Scan Kustomize overlays for versions"""
-        kustomize_base = self.repo_path / "base-kustomize"
-        if not kustomize_base.exists():
-            return
-        
-        for kustomization_file in kustomize_base.rglob("kustomization.yaml"):
-            try:
-                with open(kustomization_file, 'r') as f:
-                    kust_data = yaml.safe_load(f)
-                    
-                    # Extract images
-                    images = kust_data.get('images', [])
-                    for img in images:
-                        name = img.get('name', 'unknown')
-                        new_tag = img.get('newTag') or img.get('newName', '').split(':')[-1] if ':' in img.get('newName', '') else None
-                        
-                        if new_tag:
-                            self.inventory.append({
-                                "Component": name,
-                                "Type": "kustomize-image",
-                                "Version in Repo": new_tag,
-                                "Latest Upstream Version": None,
-                                "Source Path": str(kustomization_file.relative_to(self.repo_path)),
-                                "Notes": "Kustomize image override",
-                                "Comments": ""
-                            })
-            except Exception as e:
-                pass
-    
-    def scan_container_images(self):
-        """Scan Containerfiles/Dockerfiles for base images"""
-        containerfiles_dir = self.repo_path / "Containerfiles"
-        if containerfiles_dir.exists():
-            for containerfile in containerfiles_dir.glob("*"):
-                if containerfile.is_file():
-                    try:
-                        with open(containerfile, 'r') as f:
-                            for line in f:
-                                if line.strip().startswith('FROM'):
-                                    match = re.search(r'FROM\s+(.+?):(.+?)(?:\s|$)', line)
-                                    if match:
-                                        image = match.group(1)
-                                        tag = match.group(2)
-                                        self.inventory.append({
-                                            "Component": image.split('/')[-1],
-                                            "Type": "container-base-image",
-                                            "Version in Repo": tag,
-                                            "Latest Upstream Version": None,
-                                            "Source Path": str(containerfile.relative_to(self.repo_path)),
-                                            "Notes": f"Base image: {image}",
-                                            "Comments": ""
-                                        })
-                    except Exception as e:
-                        pass
-    
+        return rows
+
     def scan_openstack_components(self):
         """Scan OpenStack component versions"""
-        # Check helm-chart-versions.yaml
-        versions_file = self.repo_path / "helm-chart-versions.yaml"
-        if versions_file.exists():
-            try:
-                with open(versions_file, 'r') as f:
-                    versions_data = yaml.safe_load(f)
-                    charts = versions_data.get('charts', {})
-                    for component, version in charts.items():
-                        if any(x in component.lower() for x in ['keystone', 'nova', 'neutron', 'glance', 'cinder', 
-                                                                 'heat', 'barbican', 'placement', 'octavia', 'magnum',
-                                                                 'masakari', 'ceilometer', 'gnocchi', 'cloudkitty',
-                                                                 'ironic', 'designate', 'zaqar', 'blazar', 'freezer',
-                                                                 'horizon', 'skyline']):
-                            self.inventory.append({
-                                "Component": component,
-                                "Type": "openstack-service",
-                                "Version in Repo": version,
-                                "Latest Upstream Version": None,
-                                "Source Path": str(versions_file.relative_to(self.repo_path)),
-                                "Notes": "OpenStack Helm chart version",
-                                "Comments": ""
-                            })
-            except Exception as e:
-                pass
-        
-        # Scan helm configs for OpenStack image tags
-        helm_configs = self.repo_path / "base-helm-configs"
-        if helm_configs.exists():
-            openstack_services = ['keystone', 'glance', 'nova', 'cinder', 'neutron', 'heat', 
-                                 'barbican', 'placement', 'octavia', 'magnum', 'masakari',
-                                 'ceilometer', 'gnocchi', 'cloudkitty', 'ironic', 'designate',
-                                 'zaqar', 'blazar', 'freezer', 'horizon']
-            
-            for service in openstack_services:
-                config_file = helm_configs / service / f"{service}-helm-overrides.yaml"
-                if config_file.exists():
-                    try:
-                        with open(config_file, 'r') as f:
-                            content = f.read()
-                            # Extract version patterns like :2024.1-latest
-                            matches = re.findall(rf'{service}_api.*?:(.+?)(?:["\s]|$)', content)
-                            for match in matches:
-                                if match and match.strip():
-                                    self.inventory.append({
-                                        "Component": f"{service} (image)",
-                                        "Type": "openstack-service-image",
-                                        "Version in Repo": match.strip(),
-                                        "Latest Upstream Version": None,
-                                        "Source Path": str(config_file.relative_to(self.repo_path)),
-                                        "Notes": f"OpenStack {service} container image tag",
-                                        "Comments": ""
-                                    })
-                                    break
-                    except Exception as e:
-                        pass
-    
-    def scan_kubernetes_manifests(self):
-        """Scan Kubernetes manifests for API versions"""
-        manifests_dir = self.repo_path / "manifests"
-        if manifests_dir.exists():
-            api_versions = set()
-            for yaml_file in manifests_dir.rglob("*.yaml"):
-                try:
-                    with open(yaml_file, 'r') as f:
-                        for doc in yaml.safe_load_all(f):
-                            if doc and 'apiVersion' in doc:
-                                api_versions.add(doc['apiVersion'])
-                except Exception as e:
-                    pass
-            
-            for api_version in sorted(api_versions):
-                self.inventory.append({
-                    "Component": api_version.split('/')[0] if '/' in api_version else api_version,
-                    "Type": "kubernetes-api",
-                    "Version in Repo": api_version,
+        self._run_file_scanners(self._select_scanners("openstack-charts", "openstack-images"))
+
+    def _wants_helm_chart_versions(self, rel_path: str) -> bool:
+        return rel_path == "helm-chart-versions.yaml"
+
+    def _scan_helm_chart_versions_file(self, repo_file: RepoFile) -> List[Dict]:
+        rows = []
+        versions_data = repo_file.doc
+        charts = versions_data.get('charts', {})
+        for component, version in charts.items():
+            if any(x in component.lower() for x in ['keystone', 'nova', 'neutron', 'glance', 'cinder',
+                                                     'heat', 'barbican', 'placement', 'octavia', 'magnum',
+                                                     'masakari', 'ceilometer', 'gnocchi', 'cloudkitty',
+                                                     'ironic', 'designate', 'zaqar', 'blazar', 'freezer',
+                                                     'horizon', 'skyline']):
+                rows.append({
+                    "Component": component,
+                    "Type": "openstack-service",
+                    "Version in Repo": version,
                     "Latest Upstream Version": None,
-                    "Source Path": "manifests/",
-                    "Notes": f"Kubernetes API version used in manifests",
+                    "Source Path": repo_file.rel_path,
+                    "Notes": "OpenStack Helm chart version",
                     "Comments": ""
                 })
-    
+        return rows
+
+    def _wants_openstack_overrides(self, rel_path: str) -> bool:
+        parts = rel_path.split('/')
+        return (len(parts) == 3 and parts[0] == "base-helm-configs" and
+                parts[1] in OPENSTACK_SERVICES and parts[2] == f"{parts[1]}-helm-overrides.yaml")
+
+    def _scan_openstack_overrides_file(self, repo_file: RepoFile) -> List[Dict]:
+        service = repo_file.rel_path.split('/')[1]
+        # Extract version patterns like :2024.1-latest
+        matches = re.findall(rf'{service}_api.*?:(.+?)(?:["\s]|$)', repo_file.text)
+        for match in matches:
+            if match and match.strip():
+                return [{
+                    "Component": f"{service} (image)",
+                    "Type": "openstack-service-image",
+                    "Version in Repo": match.strip(),
+                    "Latest Upstream Version": None,
+                    "Source Path": repo_file.rel_path,
+                    "Notes": f"OpenStack {service} container image tag",
+                    "Comments": ""
+                }]
+        return []
+
+    def scan_kubernetes_manifests(self):
+        """Scan Kubernetes manifests for API versions"""
+        self._run_file_scanners(self._select_scanners("kubernetes-manifests"))
+
+    def _wants_manifest(self, rel_path: str) -> bool:
+        return rel_path.startswith("manifests/") and rel_path.endswith(".yaml")
+
+    def _scan_manifest_file(self, repo_file: RepoFile) -> List[Dict]:
+        return [{
+            "Component": doc['apiVersion'].split('/')[0] if '/' in doc['apiVersion'] else doc['apiVersion'],
+            "Type": "kubernetes-api",
+            "Version in Repo": doc['apiVersion'],
+            "Latest Upstream Version": None,
+            "Source Path": "manifests/",
+            "Notes": f"Kubernetes API version used in manifests",
+            "Comments": ""
+        } for doc in repo_file.docs if isinstance(doc, dict) and doc.get('apiVersion')]
+
+    def _dedupe_api_versions(self, rows: List[Dict]) -> List[Dict]:
+        """Collapse per-file API version rows into one row per API version"""
+        unique = {row["Version in Repo"]: row for row in rows}
+        return [unique[api_version] for api_version in sorted(unique)]
+
     def scan_operators_crds(self):
         """Scan for Operator CRDs"""
-        for crd_file in self.repo_path.rglob("*.yaml"):
-            if 'crd' in crd_file.name.lower() or 'crd' in str(crd_file.parent).lower():
-                try:
-                    with open(crd_file, 'r') as f:
-                        for doc in yaml.safe_load_all(f):
-                            if doc and doc.get('kind') == 'CustomResourceDefinition':
-                                spec = doc.get('spec', {})
-                                versions = spec.get('versions', [])
-                                for version in versions:
-                                    self.inventory.append({
-                                        "Component": spec.get('group', 'unknown'),
-                                        "Type": "operator-crd",
-                                        "Version in Repo": version.get('name', 'unknown'),
-                                        "Latest Upstream Version": None,
-                                        "Source Path": str(crd_file.relative_to(self.repo_path)),
-                                        "Notes": f"CRD version: {version.get('name')}",
-                                        "Comments": ""
-                                    })
-                except Exception as e:
-                    pass
-    
+        self._run_file_scanners(self._select_scanners("operators-crds"))
+
+    def _wants_crd(self, rel_path: str) -> bool:
+        # 'crd' in either the file name or one of its parent directories
+        return rel_path.endswith(".yaml") and 'crd' in rel_path.lower()
+
+    def _scan_crd_file(self, repo_file: RepoFile) -> List[Dict]:
+        rows = []
+        for doc in repo_file.docs:
+            if isinstance(doc, dict) and doc.get('kind') == 'CustomResourceDefinition':
+                spec = doc.get('spec', {})
+                versions = spec.get('versions', [])
+                for version in versions:
+                    rows.append({
+                        "Component": spec.get('group', 'unknown'),
+                        "Type": "operator-crd",
+                        "Version in Repo": version.get('name', 'unknown'),
+                        "Latest Upstream Version": None,
+                        "Source Path": repo_file.rel_path,
+                        "Notes": f"CRD version: {version.get('name')}",
+                        "Comments": ""
+                    })
+        return rows
+
     def scan_python_packages(self):
         """Scan Python requirements files"""
-        req_files = [
-            self.repo_path / "requirements.txt",
-            self.repo_path / "dev-requirements.txt",
-            self.repo_path / "doc-requirements.txt",
-        ]
-        
-        for req_file in req_files:
-            if req_file.exists():
-                try:
-                    with open(req_file, 'r') as f:
-                        for line in f:
-                            line = line.strip()
-                            if line and not line.startswith('#'):
-                                # Parse package==version
-                                match = re.match(r'^([a-zA-Z0-9_-]+(?:\[.*?\])?)(?:==|>=|<=|>|<|~=)(.+?)(?:\s|$)', line)
-                                if match:
-                                    package = match.group(1).split('[')[0]
-                                    version = match.group(2).split()[0] if match.group(2) else None
-                                    if version:
-                                        self.inventory.append({
-                                            "Component": package,
-                                            "Type": "python-package",
-                                            "Version in Repo": version,
-                                            "Latest Upstream Version": None,
-                                            "Source Path": str(req_file.relative_to(self.repo_path)),
-                                            "Notes": "",
-                                            "Comments": ""
-                                        })
-                except Exception as e:
-                    pass
-    
+        self._run_file_scanners(self._select_scanners("python-packages"))
+
+    def _wants_requirements(self, rel_path: str) -> bool:
+        return rel_path in ("requirements.txt", "dev-requirements.txt", "doc-requirements.txt")
+
+    def _scan_requirements_file(self, repo_file: RepoFile) -> List[Dict]:
+        rows = []
+        for line in repo_file.text.splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                # Parse package==version
+                match = re.match(r'^([a-zA-Z0-9_-]+(?:\[.*?\])?)(?:==|>=|<=|>|<|~=)(.+?)(?:\s|$)', line)
+                if match:
+                    package = match.group(1).split('[')[0]
+                    version = match.group(2).split()[0] if match.group(2) else None
+                    if version:
+                        rows.append({
+                            "Component": package,
+                            "Type": "python-package",
+                            "Version in Repo": version,
+                            "Latest Upstream Version": None,
+                            "Source Path": repo_file.rel_path,
+                            "Notes": "",
+                            "Comments": ""
+                        })
+        return rows
+
     def scan_ansible_roles(self):
         """Scan Ansible roles for versions"""
-        roles_dir = self.repo_path / "ansible" / "roles"
-        if roles_dir.exists():
-            for role_dir in roles_dir.iterdir():
-                if role_dir.is_dir():
-                    defaults_file = role_dir / "defaults" / "main.yml"
-                    vars_file = role_dir / "vars" / "main.yml"
-                    
-                    for config_file in [defaults_file, vars_file]:
-                        if config_file.exists():
-                            try:
-                                with open(config_file, 'r') as f:
-                                    data = yaml.safe_load(f)
-                                    if data:
-                                        for key, value in data.items():
-                                            if 'version' in key.lower() or 'tag' in key.lower():
-                                                if isinstance(value, str) and value:
-                                                    self.inventory.append({
-                                                        "Component": f"{role_dir.name}.{key}",
-                                                        "Type": "ansible-role-var",
-                                                        "Version in Repo": value,
-                                                        "Latest Upstream Version": None,
-                                                        "Source Path": str(config_file.relative_to(self.repo_path)),
-                                                        "Notes": f"Ansible role variable",
-                                                        "Comments": ""
-                                                    })
-                            except Exception as e:
-                                pass
-    
+        self._run_file_scanners(self._select_scanners("ansible-roles"))
+
+    def _wants_ansible_role_vars(self, rel_path: str) -> bool:
+        parts = rel_path.split('/')
+        return (len(parts) == 5 and parts[:2] == ["ansible", "roles"] and
+                parts[3] in ("defaults", "vars") and parts[4] == "main.yml")
+
+    def _scan_ansible_role_vars_file(self, repo_file: RepoFile) -> List[Dict]:
+        rows = []
+        role_name = repo_file.rel_path.split('/')[2]
+        data = repo_file.doc
+        if data:
+            for key, value in data.items():
+                if 'version' in key.lower() or 'tag' in key.lower():
+                    if isinstance(value, str) and value:
+                        rows.append({
+                            "Component": f"{role_name}.{key}",
+                            "Type": "ansible-role-var",
+                            "Version in Repo": value,
+                            "Latest Upstream Version": None,
+                            "Source Path": repo_file.rel_path,
+                            "Notes": f"Ansible role variable",
+                            "Comments": ""
+                        })
+        return rows
+
     def scan_cicd_workflows(self):
         """Scan GitHub Actions workflows"""
-        workflows_dir = self.repo_path / ".github" / "workflows"
-        if workflows_dir.exists():
-            for workflow_file in workflows_dir.glob("*.yml"):
-                try:
-                    with open(workflow_file, 'r') as f:
-                        workflow_data = yaml.safe_load(f)
-                        # Extract versions from workflow
-                        self._extract_workflow_versions(workflow_data, workflow_file)
-                except Exception as e:
-                    pass
-    
-    def _extract_workflow_versions(self, data: dict, file_path: Path):
+        self._run_file_scanners(self._select_scanners("cicd-workflows"))
+
+    def _wants_workflow(self, rel_path: str) -> bool:
+        parts = rel_path.split('/')
+        return len(parts) == 3 and parts[:2] == [".github", "workflows"] and parts[2].endswith(".yml")
+
+    def _scan_workflow_file(self, repo_file: RepoFile) -> List[Dict]:
+        rows = []
+        # Extract versions from workflow
+        self._extract_workflow_versions(repo_file.doc, repo_file.rel_path, rows)
+        return rows
+
+    def _extract_workflow_versions(self, data: dict, source_path: str, rows: List[Dict]):
         """Extract versions from GitHub Actions workflow"""
         if not isinstance(data, dict):
             return
-        
+
         for key, value in data.items():
             if key == 'uses' and isinstance(value, str):
                 # Extract action version
                 if '@' in value:
                     action, version = value.rsplit('@', 1)
-                    self.inventory.append({
+                    rows.append({
                         "Component": action,
                         "Type": "github-action",
                         "Version in Repo": version,
                         "Latest Upstream Version": None,
-                        "Source Path": str(file_path.relative_to(self.repo_path)),
+                        "Source Path": source_path,
                         "Notes": "GitHub Action",
                         "Comments": ""
                     })
             elif key in ['python-version', 'helm-version', 'kubectl-version', 'kube-version']:
-                self.inventory.append({
+                rows.append({
                     "Component": key,
                     "Type": "ci-cd-tool",
                     "Version in Repo": str(value),
                     "Latest Upstream Version": None,
-                    "Source Path": str(file_path.relative_to(self.repo_path)),
+                    "Source Path": source_path,
                     "Notes": f"CI/CD tool version",
                     "Comments": ""
                 })
             elif isinstance(value, dict):
-                self._extract_workflow_versions(value, file_path)
+                self._extract_workflow_versions(value, source_path, rows)
             elif isinstance(value, list):
                 for item in value:
                     if isinstance(item, dict):
-                        self._extract_workflow_versions(item, file_path)
-    
+                        self._extract_workflow_versions(item, source_path, rows)
+
     def scan_generic_images(self):
         """Scan for generic image references in YAML files"""
-        image_patterns = [
-            r'image:\s*(.+?):(.+?)(?:\s|$)',
-            r'imageTag:\s*(.+?)(?:\s|$)',
-            r'docker_image:\s*(.+?):(.+?)(?:\s|$)',
-            r'containerImage:\s*(.+?):(.+?)(?:\s|$)',
-        ]
-        
-        for yaml_file in self.repo_path.rglob("*.yaml"):
-            if '.git' in str(yaml_file):
-                continue
-            try:
-                with open(yaml_file, 'r') as f:
-                    content = f.read()
-                    for pattern in image_patterns:
-                        matches = re.finditer(pattern, content, re.MULTILINE)
-                        for match in matches:
-                            if len(match.groups()) >= 2:
-                                image = match.group(1)
-                                tag = match.group(2)
-                                if tag and tag not in ['null', 'None', '']:
-                                    self.inventory.append({
-                                        "Component": image.split('/')[-1].split(':')[0],
-                                        "Type": "generic-image",
-                                        "Version in Repo": tag,
-                                        "Latest Upstream Version": None,
-                                        "Source Path": str(yaml_file.relative_to(self.repo_path)),
-                                        "Notes": f"Image: {image}",
-                                        "Comments": ""
-                                    })
-            except Exception as e:
-                pass
-    
+        self._run_file_scanners(self._select_scanners("generic-images"))
+
+    def _wants_generic_yaml(self, rel_path: str) -> bool:
+        return rel_path.endswith(".yaml") and '.git' not in rel_path
+
+    def _scan_generic_images_file(self, repo_file: RepoFile) -> List[Dict]:
+        content = repo_file.text
+        # Cheap prefilter: every key we look for ends in "image:" or "Image:"
+        if 'mage:' not in content:
+            return []
+
+        matches = {kind: [] for kind in GENERIC_IMAGE_KINDS}
+        resume_at = dict.fromkeys(GENERIC_IMAGE_KINDS, 0)
+        for key in GENERIC_IMAGE_KEYS.finditer(content):
+            candidates = [(key.lastgroup, key.start())]
+            if key.lastgroup == 'docker_image':
+                candidates.append(('image', key.end() - len('image:')))
+            for kind, start in candidates:
+                if start < resume_at[kind]:
+                    continue
+                value = GENERIC_IMAGE_VALUE.match(content, key.end())
+                if value:
+                    matches[kind].append(value.group('name', 'tag'))
+                    resume_at[kind] = value.end()
+
+        rows = []
+        for kind in GENERIC_IMAGE_KINDS:
+            for image, tag in matches[kind]:
+                if tag and tag not in ['null', 'None', '']:
+                    rows.append({
+                        "Component": image.split('/')[-1].split(':')[0],
+                        "Type": "generic-image",
+                        "Version in Repo": tag,
+                        "Latest Upstream Version": None,
+                        "Source Path": repo_file.rel_path,
+                        "Notes": f"Image: {image}",
+                        "Comments": ""
+                    })
+        return rows
+
     def _extract_image_tags_from_yaml(self, data: dict, path: str = "") -> List[str]:
         """Recursively extract image tags from YAML structure"""
         tags = []
@@ -467,23 +659,56 @@ class VersionInventory:
             for item in data:
                 tags.extend(self._extract_image_tags_from_yaml(item, path))
         return tags
-    
+
     def enrich_with_latest_versions(self):
         """Query upstream sources for latest versions"""
         print("Enriching with latest versions (this may take a while)...")
-        
-        for item in self.inventory:
-            component = item["Component"]
-            comp_type = item["Type"]
-            current_version = item["Version in Repo"]
-            
+        self._fill_latest_versions(self.inventory)
+
+    def _fill_latest_versions(self, items: List[Dict]):
+        """Set Latest Upstream Version on items that lack it, looking up each key concurrently"""
+        # Look each (component, type) up once, whatever the number of rows sharing it
+        pending = {}
+        for item in items:
             # Skip if already has latest version
             if item["Latest Upstream Version"]:
                 continue
-            
-            latest = self._get_latest_version(component, comp_type, current_version)
-            item["Latest Upstream Version"] = latest
-    
+            key = (item["Component"], item["Type"])
+            pending.setdefault(key, []).append(item)
+
+        if not pending:
+            return
+
+        # Priority components go first, and jump the scheduler's queue too
+        keys = sorted(pending, key=lambda key: str(key[0]).lower() not in self.priority_components)
+
+        def lookup(key):
+            priority = HIGH_PRIORITY if str(key[0]).lower() in self.priority_components else NORMAL_PRIORITY
+            with self.upstream.scheduler.priority(priority):
+                return self._get_latest_version(key[0], key[1], pending[key][0]["Version in Repo"])
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(keys))) as executor:
+            results = executor.map(lookup, keys)
+            for key, latest in zip(keys, results):
+                for item in pending[key]:
+                    item["Latest Upstream Version"] = latest
+
+    @property
+    def upstream(self) -> UpstreamClient:
+        """HTTP client used for upstream lookups, created on first use (by whichever lookup thread gets there first)"""
+        if self._upstream is None:
+            with self._upstream_lock:
+                if self._upstream is None:
+                    try:
+                        cache = UpstreamCache(self.cache_file, default_ttl=self.cache_ttl)
+                    except Exception as e:
+                        print(f"Warning: upstream cache {self.cache_file} unavailable ({e}), "
+                              "results will not be cached.")
+                        cache = None
+                    self._upstream = UpstreamClient(concurrency=self.concurrency, cache=cache,
+                                                    offline=self.offline)
+        return self._upstream
+
     def _get_latest_version(self, component: str, comp_type: str, current_version: str) -> Optional[str]:
         """Get latest version from upstream source"""
         cache_key = f"{component}:{comp_type}"
@@ -514,10 +739,8 @@ class VersionInventory:
         """Query PyPI for latest version"""
         try:
             url = f"https://pypi.org/pypi/{package}/json"
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('info', {}).get('version')
+            return self.upstream.get_cached(url, f"{package}:python-package",
+                                            lambda response: response.json().get('info', {}).get('version'))
         except:
             pass
         return None
@@ -540,22 +763,9 @@ class VersionInventory:
         
         # First pass: extract versions and determine majority release
         for item in self.inventory:
-            version_in_repo = item.get("Version in Repo", "")
-            if not version_in_repo:
-                continue
-            
-            # Extract OpenStack version from chart tag
-            full_version, numeric, release, formatted = extract_version_from_chart_tag(version_in_repo)
-            
-            if full_version and numeric and release:
-                item["OpenStack Software Version"] = formatted or full_version  # Use formatted version if available
-                item["OpenStack Version (Numeric)"] = numeric
-                item["OpenStack Release Name"] = release
+            release = self._set_openstack_version_fields(item)
+            if release:
                 release_counts[release] += 1
-            else:
-                item["OpenStack Software Version"] = "Unknown"
-                item["OpenStack Version (Numeric)"] = "Unknown"
-                item["OpenStack Release Name"] = "Unknown"
         
         # Determine global (majority) release and its numeric version
         if release_counts:
@@ -605,93 +815,128 @@ class VersionInventory:
                 else:
                     item["Recommended Upstream"] = "Unknown"
     
+    def _set_openstack_version_fields(self, item: Dict) -> Optional[str]:
+        """Fill the per-row OpenStack version columns, returning the release name if known"""
+        version_in_repo = item.get("Version in Repo", "")
+        if not version_in_repo:
+            return None
+        
+        # Extract OpenStack version from chart tag
+        full_version, numeric, release, formatted = extract_version_from_chart_tag(version_in_repo)
+        
+        if full_version and numeric and release:
+            item["OpenStack Software Version"] = formatted or full_version  # Use formatted version if available
+            item["OpenStack Version (Numeric)"] = numeric
+            item["OpenStack Release Name"] = release
+            return release
+        
+        item["OpenStack Software Version"] = "Unknown"
+        item["OpenStack Version (Numeric)"] = "Unknown"
+        item["OpenStack Release Name"] = "Unknown"
+        return None
+    
     def export_to_markdown(self, output_path: Path):
         """Export inventory to Markdown table"""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        columns = set(inventory_columns(self.inventory))
+        has_openstack = OPENSTACK_RESOLVER_AVAILABLE and "OpenStack Software Version" in columns
         
-        with open(output_path, 'w') as f:
-            f.write("# Genestack Component Version Inventory\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            # Build header with optional OpenStack columns
-            # Order: Component, Type, Version in Repo, OpenStack Software Version (if available), Latest Upstream Version, then rest
-            headers = ["Component", "Type", "Version in Repo"]
-            if OPENSTACK_RESOLVER_AVAILABLE and any("OpenStack Software Version" in item for item in self.inventory):
-                headers.append("OpenStack Software Version")
-            headers.append("Latest Upstream Version")
-            if OPENSTACK_RESOLVER_AVAILABLE and any("OpenStack Software Version" in item for item in self.inventory):
-                headers.extend(["OpenStack Release Name", "Compatibility", "Recommended Upstream"])
-            headers.extend(["Source Path", "Notes", "Comments"])
-            
-            f.write("| " + " | ".join(headers) + " |\n")
-            f.write("|" + "|".join(["---" for _ in headers]) + "|\n")
-            
+        with MarkdownInventoryWriter(output_path, has_openstack) as writer:
             for item in self.inventory:
-                row = [
-                    item.get('Component', ''),
-                    item.get('Type', ''),
-                    item.get('Version in Repo', ''),
-                ]
-                # Add OpenStack Software Version right after Version in Repo
-                if OPENSTACK_RESOLVER_AVAILABLE and "OpenStack Software Version" in item:
-                    row.append(item.get('OpenStack Software Version', 'Unknown'))
-                # Add Latest Upstream Version
-                row.append(item.get('Latest Upstream Version') or 'N/A')
-                # Add remaining OpenStack fields
-                if OPENSTACK_RESOLVER_AVAILABLE and "OpenStack Software Version" in item:
-                    row.extend([
-                        item.get('OpenStack Release Name', 'Unknown'),
-                        item.get('Compatibility', 'Unknown'),
-                        item.get('Recommended Upstream', 'Unknown')
-                    ])
-                # Add Source Path, Notes, and Comments
-                row.extend([
-                    item.get('Source Path', ''),
-                    item.get('Notes', ''),
-                    item.get('Comments', '')
-                ])
-                f.write("| " + " | ".join(str(x) for x in row) + " |\n")
+                writer.write(item)
     
-    def export_to_csv(self, output_path: Path):
-        """Export inventory to CSV"""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Build fieldnames - collect all possible fields from inventory items
+    def export_to_jsonl(self, output_path: Path):
+        """Export inventory to JSON Lines (one object per row)"""
+        with JsonLinesInventoryWriter(output_path) as writer:
+            for item in self.inventory:
+                writer.write(item)
+    
+    def export_stream(self, output_dir: Path, basename: str = "component-inventory") -> int:
+        """Scan and write Markdown, CSV and JSON Lines reports row by row; returns the row count.
+
+        Unlike scan_all() followed by the export_to_* methods, rows are never
+        collected in memory (see iter_inventory() for how the output differs).
+        No Parquet file is written; an earlier one is removed so it cannot shadow the new CSV.
+        """
+        output_dir = Path(output_dir)
+        (output_dir / f"{basename}.parquet").unlink(missing_ok=True)
+        openstack = OPENSTACK_RESOLVER_AVAILABLE
+        writers = [
+            MarkdownInventoryWriter(output_dir / f"{basename}.md", openstack, compatibility=False),
+            CsvInventoryWriter(output_dir / f"{basename}.csv", stream_fieldnames(openstack)),
+            JsonLinesInventoryWriter(output_dir / f"{basename}.jsonl"),
+        ]
+        try:
+            for item in self.iter_inventory():
+                for writer in writers:
+                    writer.write(item)
+        finally:
+            for writer in writers:
+                writer.close()
+        return writers[0].count
+    
+    def _export_fieldnames(self) -> List[str]:
+        """Column order shared by the CSV and Parquet exports"""
+        # Build fieldnames from the columns present in the inventory (one pass over the rows)
         # Order: Component, Type, Version in Repo, OpenStack Software Version (if available), Latest Upstream Version, then rest
         base_fieldnames = ['Component', 'Type', 'Version in Repo']
+        present = set(inventory_columns(self.inventory))
         
         # Check if any items have OpenStack fields
-        has_openstack_fields = any("OpenStack Software Version" in item or "OpenStack Version (Numeric)" in item for item in self.inventory)
+        has_openstack_fields = "OpenStack Software Version" in present or "OpenStack Version (Numeric)" in present
         
         if has_openstack_fields:
             # Build ordered fieldnames list
             fieldnames = base_fieldnames.copy()
             # Add OpenStack Software Version right after Version in Repo
-            if any("OpenStack Software Version" in item for item in self.inventory):
+            if "OpenStack Software Version" in present:
                 fieldnames.append('OpenStack Software Version')
             # Add Latest Upstream Version
             fieldnames.append('Latest Upstream Version')
             # Add remaining OpenStack fields
             openstack_fields = ['OpenStack Release Name', 'Compatibility', 'Recommended Upstream']
             for field in openstack_fields:
-                if any(field in item for item in self.inventory):
+                if field in present:
                     fieldnames.append(field)
             # Add Source Path, Notes, and Comments
             fieldnames.extend(['Source Path', 'Notes', 'Comments'])
             # Add any other OpenStack fields that might exist (like OpenStack Version (Numeric))
-            all_fields = set()
-            for item in self.inventory:
-                all_fields.update(item.keys())
-            for field in sorted(all_fields):
+            for field in sorted(present):
                 if field not in fieldnames:
                     fieldnames.append(field)
         else:
             fieldnames = base_fieldnames + ['Latest Upstream Version', 'Source Path', 'Notes', 'Comments']
+        return fieldnames
+    
+    def export_to_csv(self, output_path: Path):
+        """Export inventory to CSV"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        fieldnames = self._export_fieldnames()
         
         with open(output_path, 'w', newline='') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
             writer.writeheader()
             writer.writerows(self.inventory)
+    
+    def export_to_parquet(self, output_path: Path) -> bool:
+        """Export inventory to Parquet with typed string columns; returns False without pyarrow"""
+        if not PYARROW_AVAILABLE:
+            return False
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        fieldnames = self._export_fieldnames()
+        columns = {name: [] for name in fieldnames}
+        for item in self.inventory:
+            for name in fieldnames:
+                value = item.get(name)
+                columns[name].append(None if value is None else str(value))
+        # Comments are edited in the dashboard; keep them non-null like the CSV round trip does
+        columns['Comments'] = [value or '' for value in columns['Comments']]
+        
+        schema = pa.schema([pa.field(name, pa.string(), nullable=(name != 'Comments')) for name in fieldnames])
+        table = pa.Table.from_pydict(columns, schema=schema)
+        pq.write_table(table, str(output_path))
+        return True
 
 
 if __name__ == "__main__":
@@ -700,6 +945,21 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scan Genestack repository for component versions")
     parser.add_argument("--repo-path", default="/root/genestack", help="Path to Genestack repository")
     parser.add_argument("--output-dir", help="Output directory for reports (default: reports/YYYY-MM-DD)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only rescan files changed (per git) since the last incremental scan")
+    parser.add_argument("--state-file", help="Incremental scan state (default: reports/.cache/version-inventory-state.json)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parse files in N worker processes (default: 1, 0 = one per CPU)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Concurrent upstream version lookups (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--cache-file", help="Upstream version cache (default: reports/.cache/upstream-cache.sqlite)")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL / 3600,
+                        help=f"Hours before a cached upstream version is revalidated (default: {DEFAULT_TTL // 3600})")
+    parser.add_argument("--offline", action="store_true",
+                        help="Do not query upstream; use cached versions however old they are")
+    parser.add_argument("--stream", action="store_true",
+                        help="Write rows to the reports as they are found instead of after the scan "
+                             "(constant memory; no Compatibility / Recommended Upstream columns)")
     args = parser.parse_args()
     
     # Determine repo path
@@ -709,9 +969,10 @@ if __name__ == "__main__":
         script_dir = Path(__file__).parent.parent
         repo_path = script_dir.resolve()
     
-    scanner = VersionInventory(repo_path=str(repo_path))
-    inventory = scanner.scan_all()
-    
+    scanner = VersionInventory(repo_path=str(repo_path), incremental=args.incremental,
+                               state_file=args.state_file, workers=args.workers,
+                               concurrency=args.concurrency, cache_file=args.cache_file,
+                               cache_ttl=args.cache_ttl * 3600, offline=args.offline)
     # Export results
     if args.output_dir:
         report_dir = Path(args.output_dir)
@@ -719,10 +980,26 @@ if __name__ == "__main__":
         report_dir = repo_path / "reports" / datetime.now().strftime("%Y-%m-%d")
     report_dir.mkdir(parents=True, exist_ok=True)
     
-    scanner.export_to_markdown(report_dir / "component-inventory.md")
-    scanner.export_to_csv(report_dir / "component-inventory.csv")
+    has_parquet = False
+    if args.stream:
+        print("Streaming version inventory scan...")
+        total = scanner.export_stream(report_dir)
+    else:
+        total = len(scanner.scan_all())
+        scanner.export_to_markdown(report_dir / "component-inventory.md")
+        scanner.export_to_csv(report_dir / "component-inventory.csv")
+        scanner.export_to_jsonl(report_dir / "component-inventory.jsonl")
+        has_parquet = scanner.export_to_parquet(report_dir / "component-inventory.parquet")
     
-    print(f"\n✅ Scan complete! Found {len(inventory)} components.")
+    print(f"\n✅ Scan complete! Found {total} components.")
     print(f"📄 Reports exported to: {report_dir}")
     print(f"   - component-inventory.md")
     print(f"   - component-inventory.csv")
+    print(f"   - component-inventory.jsonl")
+    if has_parquet:
+        print(f"   - component-inventory.parquet")
+    upstream_summary = scanner.upstream.scheduler.summary()
+    if upstream_summary:
+        print("🌐 Upstream requests:")
+        for line in upstream_summary:
+            print(f"   - {line}")